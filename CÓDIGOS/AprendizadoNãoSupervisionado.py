@@ -1,11 +1,11 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 from sklearn.cluster import KMeans
+from Dados import carregar_dados
 
 # Carrega o dataset
-df = pd.read_csv('energydata_complete.csv')
+df = carregar_dados(colunas_derivadas=False)
 
 # Seleciona apenas colunas numéricas (descarta data e variáveis categóricas)
 X = df.select_dtypes(include=['float64', 'int64'])
@@ -1,15 +1,11 @@
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from sklearn.tree import DecisionTreeRegressor, plot_tree
 from sklearn.metrics import mean_squared_error, r2_score
+from Dados import carregar_dados
 
 # ======== Carregar e preparar dados ========
-data = pd.read_csv('energydata_complete.csv')
-data['date'] = pd.to_datetime(data['date'])
-data['hour'] = data['date'].dt.hour
-data['day_of_week'] = data['date'].dt.dayofweek
-data['is_weekend'] = data['day_of_week'].apply(lambda x: 1 if x >= 5 else 0)
+data = carregar_dados()
 
 features = ['lights', 'T1', 'RH_1', 'T2', 'RH_2', 'T3', 'RH_3', 'T4', 'RH_4',
             'T5', 'RH_5', 'T6', 'RH_6', 'T7', 'RH_7', 'T8', 'RH_8', 'T9', 'RH_9',
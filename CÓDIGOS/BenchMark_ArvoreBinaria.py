@@ -1,8 +1,8 @@
-import pandas as pd
 import numpy as np
 import time
 import tracemalloc
 from sklearn.tree import DecisionTreeRegressor
+from Dados import carregar_dados
 
 def treinar_modelo(X_train, y_train):
     model = DecisionTreeRegressor(
@@ -27,11 +27,7 @@ def tempo_predicao(model, X_test, n=100):
 def benchmark_arvore_binaria():
     print("==== Benchmark: Árvore Binária ====")
     # Carregar dados
-    data = pd.read_csv('energydata_complete.csv')
-    data['date'] = pd.to_datetime(data['date'])
-    data['hour'] = data['date'].dt.hour
-    data['day_of_week'] = data['date'].dt.dayofweek
-    data['is_weekend'] = data['day_of_week'].apply(lambda x: 1 if x >= 5 else 0)
+    data = carregar_dados()
     features = ['lights', 'T1', 'RH_1', 'T2', 'RH_2', 'T3', 'RH_3', 'T4', 'RH_4',
                 'T5', 'RH_5', 'T6', 'RH_6', 'T7', 'RH_7', 'T8', 'RH_8', 'T9', 'RH_9',
                 'T_out', 'Press_mm_hg', 'RH_out', 'Windspeed', 'Visibility', 'Tdewpoint',
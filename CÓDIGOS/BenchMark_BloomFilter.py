@@ -1,42 +1,21 @@
+import os
+import tempfile
 import pandas as pd
 import math
 import time
 import tracemalloc
 import numpy as np
-import bitarray
-import hashlib
-
-# Classe Bloom Filter
-class BloomFilter:
-    def __init__(self, size, hash_count):
-        self.size = size
-        self.hash_count = hash_count
-        self.bit_array = bitarray.bitarray(size)
-        self.bit_array.setall(0)
-
-    def _hashes(self, item):
-        hashes = []
-        item_str = str(item).encode('utf-8')
-        for i in range(self.hash_count):
-            hash_result = int(hashlib.sha256(item_str + str(i).encode()).hexdigest(), 16)
-            hashes.append(hash_result % self.size)
-        return hashes
-
-    def add(self, item):
-        for hash_val in self._hashes(item):
-            self.bit_array[hash_val] = 1
-
-    def check(self, item):
-        return all(self.bit_array[hash_val] for hash_val in self._hashes(item))
+from Dados import carregar_colunas, colunas_numericas, assinatura_arquivo
+from FiltroBloom import BloomFilter, ScalableBloomFilter, CountingBloomFilter, ESQUEMAS
+from TabelaCuckoo import CuckooFilter
 
 def benchmark_bloom_filter():
     print("==== Benchmark: Bloom Filter ====")
     # Carregar dados
-    df = pd.read_csv('energydata_complete.csv')
-    colunas_numericas = df.select_dtypes(include=['float64', 'int64']).columns
-    target_col = colunas_numericas[0]  # Usar a primeira coluna numérica como exemplo
+    target_col = colunas_numericas()[0]  # Usar a primeira coluna numérica como exemplo
+    coluna = carregar_colunas([target_col])[target_col]
 
-    valores = df[target_col].dropna().unique()
+    valores = pd.unique(coluna[~np.isnan(coluna)])
     N = len(valores)
     p = 0.01  # taxa de falso positivo
     m = int(- (N * math.log(p)) / (math.log(2) ** 2))
@@ -77,11 +56,8 @@ def benchmark_bloom_filter():
         tempos.append(time.perf_counter() - start)
     tempo_medio_busca = np.mean(tempos)
 
-    # Taxa de falso positivo: busca de elementos ausentes
-    falsos_positivos = 0
-    for val in ausentes:
-        if bloom.check(val):
-            falsos_positivos += 1
+    # Taxa de falso positivo: busca de elementos ausentes (todos numa única chamada)
+    falsos_positivos = int(bloom.check_many(ausentes).sum()) if len(ausentes) > 0 else 0
     taxa_fp = falsos_positivos / len(ausentes) if len(ausentes) > 0 else 0
 
     print(f"Tempo médio de busca (presentes): {tempo_medio_busca*1000:.4f} ms")
@@ -111,4 +87,221 @@ def benchmark_bloom_filter():
         bloom.add(val)         # re-inserir (não tem efeito, mas simula operação)
         bloom.check(val)
         latencias.append(time.perf_counter() - start)
-    print(f"Latência média (ins + busca): {np.mean(latencias)*1000:.4f} ms")
\ No newline at end of file
+    print(f"Latência média (ins + busca): {np.mean(latencias)*1000:.4f} ms")
+
+    # ======================
+    # Esquemas de hash: k SHA256 por item x um digest de 128 bits (double hashing)
+    print("\n--- Esquemas de hash ---")
+    tempos = {}
+    for esquema in ESQUEMAS:
+        bloom_esquema = BloomFilter(size=m, hash_count=k, esquema=esquema)
+        start = time.perf_counter()
+        bloom_esquema.extend(valores)
+        t_ins = time.perf_counter() - start
+        start = time.perf_counter()
+        for v in valores:
+            bloom_esquema.check(v)
+        t_busca = time.perf_counter() - start
+        fp = np.mean([bloom_esquema.check(v) for v in ausentes]) if len(ausentes) > 0 else 0
+        tempos[esquema] = (t_ins, t_busca)
+        print(f"{esquema:<7}: Inserção = {N/t_ins:,.0f} itens/s | Busca = {N/t_busca:,.0f} itens/s | "
+              f"Falso positivo = {fp:.2%}")
+    print(f"Speedup do esquema duplo: Inserção = {tempos['sha256'][0]/tempos['duplo'][0]:.1f}x | "
+          f"Busca = {tempos['sha256'][1]/tempos['duplo'][1]:.1f}x")
+
+    # ======================
+    # Operações em lote: add_many / check_many x um item por vez
+    print("\n--- Lote (NumPy) x item a item ---")
+    bloom_lote = BloomFilter(size=m, hash_count=k)
+    start = time.perf_counter()
+    bloom_lote.add_many(valores)
+    t_ins_lote = time.perf_counter() - start
+    start = time.perf_counter()
+    presentes_lote = bloom_lote.check_many(valores)
+    t_busca_lote = time.perf_counter() - start
+    fp_lote = bloom_lote.check_many(ausentes).mean() if len(ausentes) > 0 else 0
+    print(f"Lote   : Inserção = {N/t_ins_lote:,.0f} itens/s | Busca = {N/t_busca_lote:,.0f} itens/s | "
+          f"Falso positivo = {fp_lote:.2%} | Presentes encontrados = {presentes_lote.mean():.0%}")
+    print(f"Speedup do lote sobre o esquema duplo: Inserção = {tempos['duplo'][0]/t_ins_lote:.1f}x | "
+          f"Busca = {tempos['duplo'][1]/t_busca_lote:.1f}x")
+
+    # ======================
+    # Persistência: reabrir o filtro salvo (mapeado em memória) x reconstruir
+    print("\n--- Persistência ---")
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, target_col + '.bloom')
+        start = time.perf_counter()
+        bloom_lote.save(caminho, assinatura_arquivo())
+        t_salvar = time.perf_counter() - start
+        start = time.perf_counter()
+        reaberto = BloomFilter.load(caminho, assinatura_arquivo())
+        t_abrir = time.perf_counter() - start
+        iguais = np.array_equal(reaberto.check_many(ausentes), bloom_lote.check_many(ausentes))
+        print(f"Salvar: {t_salvar*1000:.3f} ms | Reabrir: {t_abrir*1000:.3f} ms | Reconstruir: {t_ins_lote*1000:.3f} ms "
+              f"| Arquivo = {os.path.getsize(caminho)/1024:.1f} KB | Mesmas respostas: {iguais}")
+        del reaberto
+
+def benchmark_filtro_cuckoo():
+    print("==== Benchmark: Filtro Cuckoo x Bloom Filter ====")
+    p = 0.01  # taxa de falso positivo alvo dos dois filtros
+    colunas = carregar_colunas()
+    print(f"{'Coluna':<12} {'Filtro':<8} {'bits/elem':>9} {'add/s':>10} {'check/s':>10} {'delete/s':>10} {'FP':>7}")
+    for nome, coluna in colunas.items():
+        valores = pd.unique(coluna[~np.isnan(coluna)])
+        N = len(valores)
+        m = max(1, int(- (N * math.log(p)) / (math.log(2) ** 2)))
+        k = max(1, int((m / N) * math.log(2)))
+        # Ausentes: fora do intervalo da coluna, então qualquer positivo é falso
+        ausentes = np.random.uniform(valores.max() + 1, valores.max() + 1000, size=1000)
+
+        bloom = BloomFilter(size=m, hash_count=k)
+        start = time.perf_counter()
+        for v in valores:
+            bloom.add(v)
+        t_add = time.perf_counter() - start
+        start = time.perf_counter()
+        for v in valores:
+            bloom.check(v)
+        t_check = time.perf_counter() - start
+        fp = np.mean([bloom.check(v) for v in ausentes])
+        print(f"{nome:<12} {'Bloom':<8} {m/N:>9.2f} {N/t_add:>10,.0f} {N/t_check:>10,.0f} {'-':>10} {fp:>7.2%}")
+
+        filtro = CuckooFilter(capacidade=N, taxa_fp=p)
+        start = time.perf_counter()
+        filtro.extend(valores)
+        t_add = time.perf_counter() - start
+        start = time.perf_counter()
+        for v in valores:
+            filtro.check(v)
+        t_check = time.perf_counter() - start
+        fp = np.mean([filtro.check(v) for v in ausentes])
+        bits = filtro.bits_por_elemento()
+        start = time.perf_counter()
+        for v in valores:
+            filtro.delete(v)
+        t_delete = time.perf_counter() - start
+        print(f"{'':<12} {'Cuckoo':<8} {bits:>9.2f} {N/t_add:>10,.0f} {N/t_check:>10,.0f} {N/t_delete:>10,.0f} {fp:>7.2%}")
+
+def benchmark_bloom_blocado(tamanhos=(10**5, 10**6, 10**7, 10**8), p=0.01, bloco_insercao=10**6):
+    print("==== Benchmark: Bloom Filter blocado (64 bytes) x padrão ====")
+    # Itens sintéticos em [0, 1) gerados em pedaços (10^8 floats não cabem de uma vez com folga);
+    # ausentes em [1, 2), então todo positivo entre eles é falso
+    n_consultas = 10**6
+    n_escalar = 10**4
+    # 'sondagem' isola o acesso à memória: as posições já vêm calculadas e só os bits são lidos
+    print(f"{'Itens':>11} {'Filtro':<8} {'MB':>8} {'lote ns/busca':>14} {'sondagem ns':>12} "
+          f"{'escalar µs/busca':>17} {'FP':>7}")
+    for n in tamanhos:
+        m = int(- (n * math.log(p)) / (math.log(2) ** 2))
+        k = max(1, int((m / n) * math.log(2)))
+        for blocado in (False, True):
+            bloom = BloomFilter(size=m, hash_count=k, blocado=blocado)
+            rng = np.random.default_rng(n)
+            for inicio in range(0, n, bloco_insercao):
+                bloom.add_many(rng.random(min(bloco_insercao, n - inicio)))
+            # Presentes: o primeiro pedaço inserido, regenerado com a mesma semente
+            presentes = np.random.default_rng(n).random(min(n, n_consultas))
+            ausentes = np.random.default_rng(n + 1).random(n_consultas) + 1.0
+
+            start = time.perf_counter()
+            encontrados = bloom.check_many(presentes)
+            t_lote = time.perf_counter() - start
+            posicoes = bloom._posicoes_lote(presentes)
+            start = time.perf_counter()
+            _ = (bloom.palavras[posicoes >> np.uint64(6)] >> (posicoes & np.uint64(63))) & np.uint64(1)
+            t_sondagem = time.perf_counter() - start
+            del posicoes
+            start = time.perf_counter()
+            for v in presentes[:n_escalar].tolist():
+                bloom.check(v)
+            t_escalar = time.perf_counter() - start
+            fp = bloom.check_many(ausentes).mean()
+            assert encontrados.all(), "Bloom Filter com falso negativo"
+            nome = 'Blocado' if blocado else 'Padrão'
+            print(f"{n:>11,} {nome:<8} {bloom.palavras.nbytes/2**20:>8.1f} {t_lote/len(presentes)*1e9:>14.1f} "
+                  f"{t_sondagem/len(presentes)*1e9:>12.1f} "
+                  f"{t_escalar/min(len(presentes), n_escalar)*1e6:>17.2f} {fp:>7.2%}")
+            del bloom
+
+def benchmark_bloom_escalavel(n_inicial=10**4, n_final=10**6, p=0.01):
+    print("==== Benchmark: Bloom Filter escalável x fixo (inserções em fluxo) ====")
+    # O filtro fixo é dimensionado para os primeiros n_inicial itens, como BloomFilter.py faz com N;
+    # o escalável só conhece a taxa alvo. Os dados continuam chegando até n_final.
+    m = int(- (n_inicial * math.log(p)) / (math.log(2) ** 2))
+    k = max(1, int((m / n_inicial) * math.log(2)))
+    fixo = BloomFilter(size=m, hash_count=k)
+    escalavel = ScalableBloomFilter(capacidade_inicial=n_inicial, taxa_fp=p)
+    rng = np.random.default_rng(0)
+    ausentes = rng.random(10**5) + 1.0
+    print(f"{'Itens':>10} {'FP fixo':>9} {'FP escalável':>13} {'KB fixo':>9} {'KB escalável':>13} {'sub-filtros':>12} {'ins/s escalável':>16}")
+    inseridos = 0
+    lote = n_inicial
+    while inseridos < n_final:
+        valores = rng.random(min(lote, n_final - inseridos))
+        fixo.add_many(valores)
+        start = time.perf_counter()
+        escalavel.add_many(valores)
+        t_ins = time.perf_counter() - start
+        inseridos += len(valores)
+        lote *= 2
+        print(f"{inseridos:>10,} {fixo.check_many(ausentes).mean():>9.2%} {escalavel.check_many(ausentes).mean():>13.2%} "
+              f"{fixo.palavras.nbytes/1024:>9.1f} {escalavel.nbytes()/1024:>13.1f} {len(escalavel.filtros):>12} "
+              f"{len(valores)/t_ins:>16,.0f}")
+
+def benchmark_bloom_contador(p=0.01):
+    print("==== Benchmark: Bloom Filter com contadores (remoção e união) ====")
+    target_col = colunas_numericas()[0]
+    dados = carregar_colunas(['date', target_col])
+    coluna = np.asarray(dados[target_col], dtype=np.float64)
+    dias = np.asarray(dados['date']) // 86400  # 'date' vem em segundos desde a época
+    valores = pd.unique(coluna[~np.isnan(coluna)])
+    N = len(valores)
+    m = int(- (N * math.log(p)) / (math.log(2) ** 2))
+    k = max(1, int((m / N) * math.log(2)))
+    ausentes = np.random.uniform(valores.max() + 1, valores.max() + 1000, size=10**4)
+
+    simples = BloomFilter(size=m, hash_count=k)
+    simples.add_many(valores)
+    contador = CountingBloomFilter(size=m, hash_count=k)
+    start = time.perf_counter()
+    contador.add_many(valores)
+    t_ins = time.perf_counter() - start
+    print(f"Coluna: {target_col} | Valores únicos: {N} | m = {m}, k = {k}")
+    print(f"Memória: simples = {simples.palavras.nbytes/1024:.1f} KB | contadores = {contador.palavras.nbytes/1024:.1f} KB")
+    print(f"Falso positivo: simples = {simples.check_many(ausentes).mean():.2%} | contadores = {contador.check_many(ausentes).mean():.2%}")
+
+    # Remoção: metade dos valores sai do filtro; a outra metade continua sendo encontrada
+    metade = valores[: N // 2]
+    start = time.perf_counter()
+    contador.remove_many(metade)
+    t_rem = time.perf_counter() - start
+    restantes = contador.check_many(valores[N // 2:]).mean()
+    ainda_positivos = contador.check_many(metade).mean()
+    print(f"Inserção em lote: {N/t_ins:,.0f} itens/s | Remoção em lote: {len(metade)/t_rem:,.0f} itens/s")
+    print(f"Após remover {len(metade)} valores: restantes encontrados = {restantes:.0%} | "
+          f"removidos ainda positivos = {ainda_positivos:.2%}")
+    start = time.perf_counter()
+    for v in valores[N // 2: N // 2 + 1000]:
+        contador.remove(v)
+    t_rem_escalar = time.perf_counter() - start
+    print(f"Remoção item a item: {min(1000, N - N // 2)/t_rem_escalar:,.0f} itens/s")
+
+    # União e interseção de dois dias, sem re-hashear as leituras
+    dia1, dia2 = np.unique(dias)[:2]
+    filtro_dia1 = CountingBloomFilter(size=m, hash_count=k)
+    filtro_dia1.add_many(pd.unique(coluna[dias == dia1]))
+    filtro_dia2 = CountingBloomFilter(size=m, hash_count=k)
+    filtro_dia2.add_many(pd.unique(coluna[dias == dia2]))
+    start = time.perf_counter()
+    uniao = filtro_dia1 | filtro_dia2
+    t_uniao = time.perf_counter() - start
+    intersecao = filtro_dia1 & filtro_dia2
+    dois_dias = np.concatenate([pd.unique(coluna[dias == dia1]), pd.unique(coluna[dias == dia2])])
+    reconstruido = CountingBloomFilter(size=m, hash_count=k)
+    start = time.perf_counter()
+    reconstruido.add_many(dois_dias)
+    t_reconstruir = time.perf_counter() - start
+    comuns = np.intersect1d(pd.unique(coluna[dias == dia1]), pd.unique(coluna[dias == dia2]))
+    print(f"União de dois dias: {t_uniao*1000:.3f} ms (reconstruir: {t_reconstruir*1000:.3f} ms) | "
+          f"igual ao filtro reconstruído: {np.array_equal(uniao.contadores(), reconstruido.contadores())}")
+    print(f"Interseção: {len(comuns)} valores em comum, todos encontrados: {intersecao.check_many(comuns).all()}")
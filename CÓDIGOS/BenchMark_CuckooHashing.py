@@ -0,0 +1,80 @@
+import numpy as np
+import time
+import tracemalloc
+from Dados import carregar_dados
+from HashLinhas import fingerprint_linhas
+from TabelaCuckoo import CuckooHashTable, CuckooHashArray, CuckooHashBuckets
+
+def medir_tabela(nome, criar_tabela, chaves, valores):
+    # Inserção e busca de todas as chaves; a memória é medida numa segunda inserção,
+    # porque o tracemalloc ativo distorce os tempos
+    n = len(chaves)
+    tabela = criar_tabela()
+    start = time.perf_counter()
+    falhas = tabela.extend(zip(chaves, valores))
+    tempo_insercao = time.perf_counter() - start
+
+    tracemalloc.start()
+    tabela_mem = criar_tabela()
+    tabela_mem.extend(zip(chaves, valores))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tabela_mem
+
+    start = time.perf_counter()
+    for k in chaves:
+        _ = tabela.search(k)
+    tempo_busca = time.perf_counter() - start
+
+    print(f"\n{nome}")
+    print(f"Inserção: {tempo_insercao:.4f} s | {n/tempo_insercao:,.0f} chaves/s | Falhas = {falhas}")
+    print(f"Busca:    {tempo_busca:.4f} s | {n/tempo_busca:,.0f} chaves/s")
+    print(f"Uso de memória: Atual = {current/1024:.2f} KB | Pico = {peak/1024:.2f} KB")
+    return tempo_insercao, tempo_busca, tabela
+
+def benchmark_cuckoo_hashing():
+    print("==== Benchmark: Cuckoo Hashing ====")
+    df = carregar_dados(colunas_derivadas=False)
+    n = len(df)
+    tamanho_tabela = 2 * n
+    print(f"Linhas: {n} | Slots por tabela: {tamanho_tabela}")
+
+    # Tabela original: chave SHA256, valor = dict da linha, SHA256 + MD5 a cada posição
+    chaves_sha = fingerprint_linhas(df, 'sha256')
+    valores_dict = df.to_dict(orient='records')
+    ins_tuplas, busca_tuplas, _ = medir_tabela("CuckooHashTable (listas de tuplas, SHA256 + MD5)",
+                                            lambda: CuckooHashTable(size=tamanho_tabela), chaves_sha, valores_dict)
+
+    # Tabela em arrays: chave de 64 bits, valor = id da linha, um digest por chave
+    chaves_64 = fingerprint_linhas(df, 'hash64')
+    ids = np.arange(n)
+    ins_array, busca_array, _ = medir_tabela("CuckooHashArray (arrays NumPy, digest único de 64 bits)",
+                                          lambda: CuckooHashArray(size=tamanho_tabela), chaves_64, ids)
+
+    # Buckets de 4 slots: dimensionada pelo número de chaves (metade dos slots), com stash e rehash
+    ins_buckets, busca_buckets, tabela = medir_tabela("CuckooHashBuckets (buckets de 4 slots + stash)",
+                                                      lambda: CuckooHashBuckets(capacidade=n), chaves_64, ids)
+    slots_array = 2 * tamanho_tabela
+    slots_buckets = tabela.n_buckets * tabela.slots
+    print(f"Fator de carga: array = {n/slots_array:.2%} ({slots_array} slots) | "
+          f"buckets = {tabela.load_factor():.2%} ({slots_buckets} slots, stash = {len(tabela.stash)}, rehashes = {tabela.rehashes})")
+
+    # Operações em lote na tabela de buckets
+    tabela_lote = CuckooHashBuckets(capacidade=n)
+    start = time.perf_counter()
+    tabela_lote.insert_many(chaves_64, ids)
+    ins_lote = time.perf_counter() - start
+    start = time.perf_counter()
+    encontradas, _ = tabela_lote.search_many(chaves_64)
+    busca_lote = time.perf_counter() - start
+    start = time.perf_counter()
+    tabela_lote.remove_many(chaves_64)
+    rem_lote = time.perf_counter() - start
+    print("\nCuckooHashBuckets em lote (insert_many / search_many / remove_many)")
+    print(f"Inserção: {ins_lote:.4f} s | {n/ins_lote:,.0f} chaves/s")
+    print(f"Busca:    {busca_lote:.4f} s | {n/busca_lote:,.0f} chaves/s | Encontradas = {encontradas.sum()}")
+    print(f"Remoção:  {rem_lote:.4f} s | {n/rem_lote:,.0f} chaves/s")
+
+    print(f"\nSpeedup do modo array: Inserção = {ins_tuplas/ins_array:.2f}x | Busca = {busca_tuplas/busca_array:.2f}x")
+    print(f"Speedup do modo buckets: Inserção = {ins_tuplas/ins_buckets:.2f}x | Busca = {busca_tuplas/busca_buckets:.2f}x")
+    print(f"Speedup do lote:         Inserção = {ins_tuplas/ins_lote:.2f}x | Busca = {busca_tuplas/busca_lote:.2f}x")
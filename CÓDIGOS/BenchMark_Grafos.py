@@ -1,9 +1,9 @@
-import pandas as pd
 import numpy as np
 import networkx as nx
 import time
 import tracemalloc
 import random
+from Dados import carregar_dados
 
 def node_color(node, categories):
     for cat, vars in categories.items():
@@ -15,8 +15,7 @@ def node_color(node, categories):
 def benchmark_grafo():
     print("==== Benchmark: Grafo (NetworkX) ====")
     # Carregar dados
-    data = pd.read_csv('energydata_complete.csv')
-    data['date'] = pd.to_datetime(data['date'])
+    data = carregar_dados(colunas_derivadas=False)
     features = data.select_dtypes(include=[np.number])
     corr_matrix = features.corr()
     threshold = 0.3
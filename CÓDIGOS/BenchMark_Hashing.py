@@ -1,9 +1,11 @@
-import pandas as pd
 import hashlib
 import time
 import tracemalloc
 import numpy as np
 from collections import defaultdict
+from Dados import carregar_dados
+from HashLinhas import fingerprint_linhas, fingerprint_linhas_paralelo, curva_speedup, MODOS
+from TabelaHash import TabelaLinhas, IndiceHashAberto
 
 def hash_row(row):
     row_str = ','.join(map(str, row.values))
@@ -13,11 +15,28 @@ def hash_row(row):
 def benchmark_hashing():
     print("==== Benchmark: Hashing ====")
     # Carregar dataset
-    df = pd.read_csv('energydata_complete.csv')
+    df = carregar_dados(colunas_derivadas=False)
     
+    # Vazão de cada forma de gerar os hashes (linhas/s)
+    print("--- Geração de hashes ---")
+    start = time.perf_counter()
+    _ = df.apply(hash_row, axis=1)
+    t = time.perf_counter() - start
+    print(f"apply(hash_row) [texto + SHA256]: {t:.4f} s | {len(df)/t:,.0f} linhas/s")
+    for modo in MODOS:
+        start = time.perf_counter()
+        _ = fingerprint_linhas(df, modo)
+        t = time.perf_counter() - start
+        print(f"fingerprint_linhas [{modo}]: {t:.4f} s | {len(df)/t:,.0f} linhas/s")
+
+    # Modo paralelo (SHA256): vazão por processo e speedup de 1 a N núcleos
+    print("\n--- Hash paralelo (sha256) ---")
+    _ = fingerprint_linhas_paralelo(df, 'sha256')
+    curva_speedup(df, 'sha256')
+
     # Gerar coluna de hash
     start = time.perf_counter()
-    df['hash'] = df.apply(hash_row, axis=1)
+    df['hash'] = fingerprint_linhas(df, 'sha256')
     tempo_hash = time.perf_counter() - start
 
     # Preparação para benchmarking
@@ -47,6 +66,24 @@ def benchmark_hashing():
     print(f"Uso de memória hash table: Atual = {current/1024:.2f} KB | Pico = {peak/1024:.2f} KB")
     print(f"Taxa de colisão: {colisoes}/{n} = {colisoes/n:.4%}")
 
+    # Layout compacto: hash -> número da linha, valores lidos das colunas só na busca
+    tracemalloc.start()
+    start = time.perf_counter()
+    tabela_compacta = TabelaLinhas(df)
+    tabela_compacta.inserir_muitos(df['hash'], df.index)
+    tempo_compacta = time.perf_counter() - start
+    current_compacta, peak_compacta = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("\n--- Armazenamento: dict por linha vs. número da linha ---")
+    print(f"Dict por linha:    Inserção = {tempo_insercao:.4f} s | Memória = {current/1024:.2f} KB (pico {peak/1024:.2f} KB)")
+    print(f"Número da linha:   Inserção = {tempo_compacta:.4f} s | Memória = {current_compacta/1024:.2f} KB (pico {peak_compacta/1024:.2f} KB)")
+    print(f"Redução de memória: {current/max(current_compacta, 1):.1f}x | Speedup de inserção: {tempo_insercao/tempo_compacta:.1f}x")
+    amostra = df['hash'].sample(min(100, n)).tolist()
+    start = time.perf_counter()
+    for hash_key in amostra:
+        _ = tabela_compacta.get(hash_key)
+    print(f"Tempo médio de busca com materialização da linha: {(time.perf_counter() - start)/len(amostra)*1000:.4f} ms\n")
+
     # Tempo de busca (por índice aleatório)
     n_buscas = min(100, n)
     busca_indices = np.random.choice(indices, size=n_buscas, replace=False)
@@ -116,4 +153,35 @@ def benchmark_hashing():
             else:
                 hash_table_test[hash_key] = row.to_dict()
         t = time.perf_counter() - start
-        print(f"{n_test} elementos: Inserção = {t:.6f} s, Colisões = {colisoes_test}, Taxa = {colisoes_test/n_test:.4%}")
\ No newline at end of file
+        print(f"{n_test} elementos: Inserção = {t:.6f} s, Colisões = {colisoes_test}, Taxa = {colisoes_test/n_test:.4%}")
+    # Índice de endereçamento aberto em NumPy vs. dict, em lote (deduplicação + pertinência)
+    print("\n--- Índice aberto (NumPy) vs. dict: inserção e busca em lote ---")
+    fingerprints = fingerprint_linhas(df.drop(columns='hash'), 'hash64')
+    rng = np.random.default_rng()
+    for n_test in [n, 100_000, 1_000_000]:
+        if n_test == n:
+            chaves = fingerprints
+        else:
+            chaves = rng.integers(0, 2**63, size=n_test, dtype=np.uint64)
+        ids = np.arange(n_test, dtype=np.int32)
+
+        start = time.perf_counter()
+        d = {}
+        for k, i in zip(chaves.tolist(), ids.tolist()):
+            d.setdefault(k, i)
+        t_ins_dict = time.perf_counter() - start
+        start = time.perf_counter()
+        _ = [d.get(k, -1) for k in chaves.tolist()]
+        t_busca_dict = time.perf_counter() - start
+
+        indice = IndiceHashAberto(capacidade=n_test)
+        start = time.perf_counter()
+        indice.insert_many(chaves, ids)
+        t_ins_idx = time.perf_counter() - start
+        start = time.perf_counter()
+        _ = indice.lookup_many(chaves)
+        t_busca_idx = time.perf_counter() - start
+
+        print(f"{n_test} chaves: dict = {t_ins_dict:.4f} s ins / {t_busca_dict:.4f} s busca | "
+              f"índice aberto = {t_ins_idx:.4f} s ins / {t_busca_idx:.4f} s busca "
+              f"({indice.chaves.nbytes + indice.ids.nbytes:,} bytes)")
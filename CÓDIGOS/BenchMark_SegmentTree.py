@@ -1,18 +1,15 @@
-import pandas as pd
 import numpy as np
 import time
 import tracemalloc
 from SegmentTree import SegmentTree
+from Dados import carregar_colunas, colunas_numericas
 
 def benchmark_segment_tree():
     print("==== Benchmark: Segment Tree ====")
-    # Carregar dataset
-    data = pd.read_csv('energydata_complete.csv')
-
-    # Selecionar colunas numéricas
-    num_cols = data.select_dtypes(include=[np.number]).columns
+    # Selecionar colunas numéricas e mapear só a coluna testada
+    num_cols = colunas_numericas()
     target_col = num_cols[0]  # Escolha a primeira coluna numérica como exemplo
-    arr = data[target_col].values
+    arr = carregar_colunas([target_col])[target_col]
     n = len(arr)
 
     # Tempo de construção (inserção) e uso de memória
@@ -80,13 +77,22 @@ def benchmark_segment_tree():
     print(f"Latência média (update + query + remove): {np.mean(latencias)*1000:.4f} ms")
 
     # Escalabilidade: testando diferentes tamanhos de entrada
+    # (acima do tamanho da coluna, valores sintéticos na mesma faixa)
     print("\n--- Escalabilidade ---")
-    for n_test in [100, 1000, 5000, min(10000, n)]:
-        arr_test = arr[:n_test]
+    rng = np.random.default_rng(0)
+    for n_test in [100, 1000, 5000, min(10000, n), 10**5, 10**6, 10**7]:
+        arr_test = arr[:n_test] if n_test <= n else rng.uniform(arr.min(), arr.max(), size=n_test)
         tracemalloc.start()
         start = time.perf_counter()
         st_test = SegmentTree(arr_test)
         tempo_build = time.perf_counter() - start
         cur, pk = tracemalloc.get_traced_memory()
         tracemalloc.stop()
-        print(f"{n_test} elementos: Construção = {tempo_build:.6f} s, Memória = {cur/1024:.2f} KB (pico {pk/1024:.2f} KB)")
+        ls = rng.integers(0, n_test, size=1000)
+        rs = ls + rng.integers(1, n_test + 1 - ls)
+        start = time.perf_counter()
+        for l, r in zip(ls.tolist(), rs.tolist()):
+            st_test.query(l, r)
+        tempo_query = (time.perf_counter() - start) / len(ls)
+        print(f"{n_test} elementos: Construção = {tempo_build:.6f} s, Memória = {cur/1024:.2f} KB (pico {pk/1024:.2f} KB), "
+              f"Query = {tempo_query*1e6:.2f} µs")
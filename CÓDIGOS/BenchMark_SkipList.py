@@ -1,20 +1,135 @@
 import pandas as pd
 import numpy as np
+import threading
 import time
 import tracemalloc
-from SkipList import SkipList
+from EstruturaSkipList import SkipList, SkipListArray, SkipListIndexavel, SkipListConcorrente, SkipListTemporal
+from Dados import carregar_colunas, colunas_numericas
+
+# Layout original do nó (objeto com __dict__), só como referência para o comparativo de memória
+class _NodeComDict:
+    def __init__(self, key, level):
+        self.key = key
+        self.forward = [None] * (level + 1)
+
+class _SkipListNodeComDict(SkipList):
+    def createNode(self, lvl, key):
+        return _NodeComDict(key, lvl)
+
+def _medir_layout(nome, criar, valores):
+    # Memória numa construção com tracemalloc; tempos numa segunda, sem ele
+    tracemalloc.start()
+    lista = criar()
+    for v in valores:
+        lista.insertElement(v)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del lista
+    lista = criar()
+    start = time.perf_counter()
+    for v in valores:
+        lista.insertElement(v)
+    tempo_ins = time.perf_counter() - start
+    start = time.perf_counter()
+    for v in valores:
+        lista.searchElement(v)
+    tempo_busca = time.perf_counter() - start
+    n = len(valores)
+    print(f"{nome:<22} {current/n:>10.1f} {n/tempo_ins:>14,.0f} {n/tempo_busca:>14,.0f}")
+
+class _SkipListTravaGlobal:
+    # Referência para o benchmark concorrente: a SkipList comum atrás de uma única trava
+    def __init__(self, P=0.5):
+        self.lista = SkipList(P=P)
+        self.trava = threading.Lock()
+
+    def insertElement(self, key):
+        with self.trava:
+            self.lista.insertElement(key)
+
+    def deleteElement(self, key):
+        with self.trava:
+            self.lista.deleteElement(key)
+
+    def searchElement(self, key):
+        with self.trava:
+            return self.lista.searchElement(key)
+
+def _rodar_threads(lista, chaves, escritores, leitores, duracao):
+    # Escritores alternam inserção e remoção de chaves sorteadas; leitores só buscam.
+    # Devolve (operações de escrita, operações de leitura) feitas em `duracao` segundos.
+    parar = threading.Event()
+    largada = threading.Barrier(escritores + leitores + 1)
+    contagem = [0] * (escritores + leitores)
+
+    def escritor(t):
+        rng = np.random.default_rng(t)
+        sorteio = rng.choice(chaves, size=4096).tolist()
+        largada.wait()
+        ops = 0
+        while not parar.is_set():
+            k = sorteio[ops % 4096]
+            if ops & 1:
+                lista.deleteElement(k)
+            else:
+                lista.insertElement(k)
+            ops += 1
+        contagem[t] = ops
+
+    def leitor(t):
+        rng = np.random.default_rng(t)
+        sorteio = rng.choice(chaves, size=4096).tolist()
+        largada.wait()
+        ops = 0
+        while not parar.is_set():
+            lista.searchElement(sorteio[ops % 4096])
+            ops += 1
+        contagem[t] = ops
+
+    threads = [threading.Thread(target=escritor, args=(t,)) for t in range(escritores)]
+    threads += [threading.Thread(target=leitor, args=(t,)) for t in range(escritores, escritores + leitores)]
+    for th in threads:
+        th.start()
+    largada.wait()
+    time.sleep(duracao)
+    parar.set()
+    for th in threads:
+        th.join()
+    return sum(contagem[:escritores]), sum(contagem[escritores:])
+
+def benchmark_skiplist_concorrente(escritores=(1, 2, 4), leitores=(0, 1, 4), duracao=1.0):
+    """N threads escritoras x M leitoras: ops/s da lazy skip list e da SkipList com trava global.
+
+    Em CPython com GIL as threads não rodam bytecode em paralelo; o que se mede é o custo das
+    travas e a disputa entre elas, não speedup de núcleos.
+    """
+    print("==== Benchmark: Skip List concorrente ====")
+    target_col = colunas_numericas()[0]
+    coluna = carregar_colunas([target_col])[target_col]
+    valores = pd.unique(coluna[~np.isnan(coluna)])
+    print(f"Coluna: {target_col} | {len(valores)} chaves iniciais | {duracao:.1f} s por configuração")
+    print(f"{'Estrutura':<14} {'N esc.':>6} {'M leit.':>7} {'escritas/s':>12} {'leituras/s':>12} {'total ops/s':>12}")
+    for nome, criar in (("Lazy (nó)", lambda: SkipListConcorrente(P=0.5)),
+                        ("Trava global", lambda: _SkipListTravaGlobal(P=0.5))):
+        for n_esc in escritores:
+            for m_leit in leitores:
+                lista = criar()
+                for v in valores[::2]:
+                    lista.insertElement(v)
+                esc, leit = _rodar_threads(lista, valores, n_esc, m_leit, duracao)
+                print(f"{nome:<14} {n_esc:>6} {m_leit:>7} {esc/duracao:>12,.0f} {leit/duracao:>12,.0f} "
+                      f"{(esc + leit)/duracao:>12,.0f}")
 
 def benchmark_skiplist():
     print("==== Benchmark: Skip List ====")
     # Carregar dataset
-    df = pd.read_csv('energydata_complete.csv')
-    colunas_numericas = df.select_dtypes(include=['float64', 'int64']).columns
-    target_col = colunas_numericas[0]  # Escolhe a primeira coluna numérica para o teste
-    valores = df[target_col].dropna().unique()
+    target_col = colunas_numericas()[0]  # Escolhe a primeira coluna numérica para o teste
+    coluna = carregar_colunas([target_col])[target_col]
+    valores = pd.unique(coluna[~np.isnan(coluna)])
     n = len(valores)
 
     # Parâmetros da Skip List
-    max_lvl = 4
+    max_lvl = None  # teto de nível adaptativo: log_{1/P}(n)
     P = 0.5
 
     # Tempo de inserção e uso de memória
@@ -94,4 +209,123 @@ def benchmark_skiplist():
         cur, pk = tracemalloc.get_traced_memory()
         tracemalloc.stop()
         print(f"{n_test} elementos: Inserção = {tempo_ins:.6f} s, Memória = {cur/1024:.2f} KB (pico {pk/1024:.2f} KB)")
-        
\ No newline at end of file
+
+    # Layout dos nós: objeto com __dict__ x __slots__ x arrays por nível
+    print("\n--- Layout dos nós ---")
+    print(f"{'Layout':<22} {'bytes/elem':>10} {'inserções/s':>14} {'buscas/s':>14}")
+    _medir_layout("Nó com __dict__", lambda: _SkipListNodeComDict(max_lvl=max_lvl, P=P), valores)
+    _medir_layout("Nó com __slots__", lambda: SkipList(max_lvl=max_lvl, P=P), valores)
+    _medir_layout("Struct-of-arrays", lambda: SkipListArray(max_lvl=max_lvl, P=P, capacidade=n + 1), valores)
+
+    # Construção de todas as colunas numéricas: inserção um a um x from_sorted
+    print("\n--- Construção das colunas: insertElement x from_sorted ---")
+    colunas = carregar_colunas(colunas_numericas())
+    for nome, classe in (("SkipList", SkipList), ("SkipListArray", SkipListArray)):
+        start = time.perf_counter()
+        for col in colunas.values():
+            lista = classe(P=P)
+            lista.extend(pd.unique(col[~np.isnan(col)]))
+        t_insercao = time.perf_counter() - start
+        start = time.perf_counter()
+        for col in colunas.values():
+            lista = classe.from_sorted(col, P=P)
+        t_bulk = time.perf_counter() - start
+        print(f"{nome:<14} {len(colunas)} colunas: insertElement = {t_insercao:.4f} s | "
+              f"from_sorted = {t_bulk:.4f} s | Speedup = {t_insercao/t_bulk:.1f}x")
+
+    # Busca em lote: uma descida completa por valor x busca por dedo com as sondas ordenadas
+    print("\n--- Busca em lote: searchElement x search_many ---")
+    rng = np.random.default_rng(0)
+    sintetica = rng.random(10**6)
+    cenarios = [(f"coluna {target_col} ({n} chaves)", valores, np.random.choice(valores, size=10**5)),
+                ("sintético (10^6 chaves)", sintetica, rng.choice(sintetica, size=10**5))]
+    for descricao, chaves, sondas in cenarios:
+        for nome, classe in (("SkipList", SkipList), ("SkipListArray", SkipListArray)):
+            lista = classe.from_sorted(chaves, P=P)
+            start = time.perf_counter()
+            for v in sondas.tolist():
+                lista.searchElement(v)
+            t_um = time.perf_counter() - start
+            start = time.perf_counter()
+            lista.search_many(sondas)
+            t_lote = time.perf_counter() - start
+            print(f"{descricao:<32} {nome:<14} 10^5 sondas: searchElement = {t_um:.4f} s | "
+                  f"search_many = {t_lote:.4f} s | Speedup = {t_um/t_lote:.1f}x")
+
+    # Consultas de ordem: skip list indexável x varredura completa com pandas
+    print("\n--- Consultas de ordem (skip list indexável x varredura) ---")
+    indexavel = SkipListIndexavel.from_sorted(coluna, P=P)
+    serie = pd.Series(valores)
+    consultas = np.sort(np.random.choice(valores, size=(n_buscas, 2)), axis=1).tolist()
+    percentis = np.random.uniform(0, 100, size=n_buscas).tolist()
+    operacoes = [
+        ("rank (valores abaixo de x)",
+         lambda: [indexavel.rank(lo) for lo, _ in consultas],
+         lambda: [int((serie < lo).sum()) for lo, _ in consultas]),
+        ("percentil",
+         lambda: [indexavel.percentil(q) for q in percentis],
+         lambda: [serie.quantile(q / 100) for q in percentis]),
+        ("range(lo, hi)",
+         lambda: [list(indexavel.range(lo, hi)) for lo, hi in consultas],
+         lambda: [serie[serie.between(lo, hi)].sort_values().tolist() for lo, hi in consultas]),
+    ]
+    for nome, skip_op, pandas_op in operacoes:
+        start = time.perf_counter()
+        skip_op()
+        t_skip = time.perf_counter() - start
+        start = time.perf_counter()
+        pandas_op()
+        t_pandas = time.perf_counter() - start
+        print(f"{nome:<28} skip list = {t_skip/n_buscas*1000:.4f} ms | pandas = {t_pandas/n_buscas*1000:.4f} ms | "
+              f"Speedup = {t_pandas/t_skip:.1f}x")
+
+    # Índice temporal: multimapa data -> linha, com inserções fora de ordem e instantes repetidos
+    print("\n--- Índice temporal (data -> linha) ---")
+    datas = carregar_colunas(['date'])['date']
+    start = time.perf_counter()
+    indice = SkipListTemporal.from_sorted(datas, P=P)
+    t_bulk = time.perf_counter() - start
+    atrasadas = np.random.permutation(len(datas))  # chegada fora de ordem
+    start = time.perf_counter()
+    indice_ins = SkipListTemporal(P=P)
+    for linha in atrasadas.tolist():
+        indice_ins.insertElement(int(datas[linha]), linha)
+    t_ins = time.perf_counter() - start
+    for linha in atrasadas[:1000].tolist():  # leituras repetidas do mesmo instante
+        indice_ins.insertElement(int(datas[linha]), -linha)
+    print(f"{len(datas)} leituras: from_sorted = {t_bulk:.4f} s | insertElement fora de ordem = {t_ins:.4f} s | "
+          f"com 1000 instantes repetidos: {len(indice_ins)} leituras guardadas")
+    serie_datas = pd.Series(datas)
+    janelas = np.random.choice(datas, size=n_buscas).tolist()
+    dia = 24 * 3600
+    start = time.perf_counter()
+    for t0 in janelas:
+        list(indice.range(t0, t0 + dia))
+    t_range = time.perf_counter() - start
+    start = time.perf_counter()
+    for t0 in janelas:
+        serie_datas[serie_datas.between(t0, t0 + dia)].index.tolist()
+    t_pandas = time.perf_counter() - start
+    print(f"range de 1 dia (~144 leituras): skip list = {t_range/n_buscas*1000:.4f} ms | "
+          f"pandas = {t_pandas/n_buscas*1000:.4f} ms | Speedup = {t_pandas/t_range:.1f}x")
+
+    # Busca com teto adaptativo x teto fixo (max_lvl=4) em chaves sintéticas até 10^6
+    # (o teto fixo para em 10^5: acima disso a construção sozinha leva minutos)
+    print("\n--- Escalabilidade da busca (teto adaptativo x max_lvl=4) ---")
+    n_buscas = 10**4
+    for n_test in [10**3, 10**4, 10**5, 10**6]:
+        chaves = rng.random(n_test).tolist()
+        amostra = rng.choice(n_test, size=n_buscas).tolist()
+        linha = f"{n_test:>9,} chaves (log2 n = {np.log2(n_test):.1f}):"
+        for nome, teto in (("adaptativo", None), ("fixo", 4)):
+            if teto is not None and n_test > 10**5:
+                continue
+            lista = SkipList(max_lvl=teto, P=P)
+            for k in chaves:
+                lista.insertElement(k)
+            start = time.perf_counter()
+            for i in amostra:
+                lista.searchElement(chaves[i])
+            t = time.perf_counter() - start
+            linha += f" {nome} = {t/n_buscas*1e6:.2f} µs/busca (teto {lista.MAXLVL}) |"
+        print(linha.rstrip(" |"))
@@ -1,73 +1,94 @@
 import pandas as pd
-import hashlib
+import numpy as np
+import os
 import math
-import bitarray
-
-# ----------------------------
-# Estrutura de Bloom Filter
-class BloomFilter:
-    def __init__(self, size, hash_count):
-        self.size = size
-        self.hash_count = hash_count
-        self.bit_array = bitarray.bitarray(size)
-        self.bit_array.setall(0)
-
-    def _hashes(self, item):
-        hashes = []
-        item_str = str(item).encode('utf-8')
-        for i in range(self.hash_count):
-            hash_result = int(hashlib.sha256(item_str + str(i).encode()).hexdigest(), 16)
-            hashes.append(hash_result % self.size)
-        return hashes
-
-    def add(self, item):
-        for hash_val in self._hashes(item):
-            self.bit_array[hash_val] = 1
-
-    def check(self, item):
-        return all(self.bit_array[hash_val] for hash_val in self._hashes(item))
+from Dados import carregar_colunas, tipos_colunas, ler_em_blocos, assinatura_arquivo, ARQUIVO_PADRAO
+from FiltroBloom import BloomFilter, ScalableBloomFilter, CountingBloomFilter
 
 # ----------------------------
 # Carregando o dataset real
 
 try:
-    df = pd.read_csv('energydata_complete.csv')
-    print("Dataset carregado com sucesso.")
+    tipos = tipos_colunas()  # só o cabeçalho e os tipos: os valores são lidos depois, em blocos
+    print("Colunas do dataset identificadas com sucesso.")
 except FileNotFoundError:
     print("Arquivo 'energydata_complete.csv' não encontrado. Verifique o caminho e tente novamente.")
     exit()
 
-# Selecionar colunas numéricas (int64 e float64)
-colunas_numericas = df.select_dtypes(include=['float64', 'int64']).columns
+colunas_numericas = list(tipos)
 
 print("\nColunas numéricas detectadas:")
 for c in colunas_numericas:
-    print(f"- {c} (tipo: {df[c].dtype})")
+    print(f"- {c} (tipo: {tipos[c]})")
 
 # Criar Bloom Filter para cada coluna numérica
 bloom_filters = {}
 
 # Parâmetros do Bloom Filter
-N = len(df)  # número de elementos
 p = 0.01     # taxa de falso positivo (1%)
+ESQUEMA = 'duplo'  # 'duplo': um digest de 128 bits por valor | 'sha256': k chamadas de SHA256 (original)
+BLOCADO = False    # True: os k bits de cada valor numa única linha de cache de 64 bytes (só no esquema 'duplo')
+ESCALAVEL = True   # True: filtros escaláveis alimentados bloco a bloco, sem dimensionar por N antes
+CONTADOR = False   # True: contadores de 4 bits, permitem remover valores (usa o dimensionamento por N)
 
-# Tamanho ótimo do bit array e número de hashes
-m = - (N * math.log(p)) / (math.log(2) ** 2)
-k = (m / N) * math.log(2)
+# Filtros salvos entre execuções (um arquivo por coluna), reabertos mapeados em memória.
+# A assinatura junta a versão do CSV e os parâmetros acima: mudou qualquer um, reconstrói.
+PASTA_FILTROS = ARQUIVO_PADRAO + '.bloom'
+assinatura = (assinatura_arquivo(), p, ESQUEMA, BLOCADO, ESCALAVEL and not CONTADOR, CONTADOR)
+classe_salva = ScalableBloomFilter if ESCALAVEL and not CONTADOR else BloomFilter
 
-m = int(m)
-k = int(k)
-
-print(f"\nParâmetros do Bloom Filter: tamanho bit array = {m}, número de funções hash = {k}")
+def _arquivo_filtro(coluna):
+    return os.path.join(PASTA_FILTROS, coluna + '.bloom')
 
 for coluna in colunas_numericas:
-    print(f"\nCriando Bloom Filter para a coluna: {coluna}")
-    bloom = BloomFilter(size=m, hash_count=k)
-    valores = df[coluna].dropna().unique()
-    for valor in valores:
-        bloom.add(valor)
+    bloom = classe_salva.load(_arquivo_filtro(coluna), assinatura)
+    if bloom is None:
+        break
     bloom_filters[coluna] = bloom
-    print(f"Bloom Filter criado com {len(valores)} valores únicos.")
+
+reabertos = len(bloom_filters) == len(colunas_numericas)
+if reabertos:
+    print(f"\nBloom Filters reabertos de '{PASTA_FILTROS}' (mapeados em memória), sem reconstrução.")
+elif ESCALAVEL and not CONTADOR:
+    # Sub-filtros são adicionados conforme os valores chegam, mantendo a taxa alvo
+    print(f"\nParâmetros do Bloom Filter: escalável, taxa de falso positivo alvo = {p:.0%}, esquema = {ESQUEMA}")
+    for coluna in colunas_numericas:
+        bloom_filters[coluna] = ScalableBloomFilter(taxa_fp=p, esquema=ESQUEMA, blocado=BLOCADO)
+    for bloco in ler_em_blocos(colunas=colunas_numericas):
+        for coluna in colunas_numericas:
+            valores = bloco[coluna].to_numpy()
+            bloom_filters[coluna].add_many(valores[~np.isnan(valores)])
+    for coluna, bloom in bloom_filters.items():
+        print(f"Bloom Filter da coluna {coluna}: {len(bloom)} valores únicos em {len(bloom.filtros)} sub-filtro(s).")
+else:
+    df = carregar_colunas(colunas_numericas)  # o dimensionamento por N precisa das colunas inteiras
+    N = len(df[colunas_numericas[0]])  # número de elementos
+
+    # Tamanho ótimo do bit array e número de hashes
+    m = - (N * math.log(p)) / (math.log(2) ** 2)
+    k = (m / N) * math.log(2)
+
+    m = int(m)
+    k = int(k)
+
+    print(f"\nParâmetros do Bloom Filter: tamanho bit array = {m}, número de funções hash = {k}, esquema = {ESQUEMA}")
+
+    for coluna in colunas_numericas:
+        print(f"\nCriando Bloom Filter para a coluna: {coluna}")
+        classe = CountingBloomFilter if CONTADOR else BloomFilter
+        bloom = classe(size=m, hash_count=k, esquema=ESQUEMA, blocado=BLOCADO)
+        valores = pd.unique(df[coluna][~np.isnan(df[coluna])])
+        bloom.add_many(valores)  # hashing vetorizado e todas as posições escritas de uma vez
+        bloom_filters[coluna] = bloom
+        print(f"Bloom Filter criado com {len(valores)} valores únicos.")
+
+if not reabertos:
+    try:
+        os.makedirs(PASTA_FILTROS, exist_ok=True)
+        for coluna, bloom in bloom_filters.items():
+            bloom.save(_arquivo_filtro(coluna), assinatura)
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar os Bloom Filters em '{PASTA_FILTROS}': {e}")
 
 # ----------------------------
 # Teste de operação
@@ -83,6 +104,8 @@ bloom = bloom_filters[col_teste]
 while True:
     print("\nOperações disponíveis:")
     print("1 - Verificar se valor possivelmente está no conjunto")
+    if CONTADOR:
+        print("2 - Remover valor (ex.: leitura de sensor corrigida)")
     print("0 - Sair")
     opcao = input("Escolha a operação: ")
 
@@ -90,7 +113,7 @@ while True:
         print("Encerrando.")
         break
 
-    if opcao != '1':
+    if opcao not in ('1', '2') or (opcao == '2' and not CONTADOR):
         print("Opção inválida. Tente novamente.")
         continue
 
@@ -101,6 +124,11 @@ while True:
         print("Valor inválido, deve ser numérico.")
         continue
 
+    if opcao == '2':
+        removido = bloom.remove(valor)
+        print("Valor removido." if removido else "Valor não estava no filtro.")
+        continue
+
     resultado = bloom.check(valor)
     print(f"Resultado: {'Possivelmente está presente' if resultado else 'Com certeza não está presente'}")
     
\ No newline at end of file
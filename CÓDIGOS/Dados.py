@@ -0,0 +1,183 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+ARQUIVO_PADRAO = 'energydata_complete.csv'
+COLUNAS_DERIVADAS = ['hour', 'day_of_week', 'is_weekend']
+
+# Cache por processo: caminho absoluto -> (assinatura do arquivo, DataFrame enriquecido)
+_cache = {}
+
+def _copy_on_write():
+    """Copy-on-Write ativo: sempre a partir do pandas 3.0; antes, só se o ponto de entrada ligou a opção"""
+    return int(pd.__version__.split('.')[0]) >= 3 or pd.get_option('mode.copy_on_write') is True
+
+def _assinatura(caminho):
+    """Identifica a versão do arquivo pelo mtime e tamanho"""
+    info = os.stat(caminho)
+    return (info.st_mtime_ns, info.st_size)
+
+# ==========================
+# Cache colunar em disco (um .npy por coluna ao lado do CSV)
+# 'date' é gravada como int64 (segundos desde a época); os sensores mantêm o dtype do CSV
+
+def _pasta_cache(caminho):
+    return caminho + '.cache'
+
+def _meta_cache(caminho, assinatura):
+    """Devolve os metadados do cache colunar se ele corresponder à versão atual do CSV"""
+    try:
+        with open(os.path.join(_pasta_cache(caminho), 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get('assinatura') != list(assinatura):
+        return None
+    return meta
+
+def _gravar_cache(caminho, df, assinatura):
+    pasta = _pasta_cache(caminho)
+    colunas = [c for c in df.columns if c not in COLUNAS_DERIVADAS]
+    tipos = {}
+    try:
+        os.makedirs(pasta, exist_ok=True)
+        for col in colunas:
+            if col == 'date':
+                arr = df['date'].to_numpy().astype('datetime64[s]').astype(np.int64)
+            elif df[col].dtype.kind in 'biuf':
+                arr = df[col].to_numpy()
+            else:
+                arr = df[col].to_numpy().astype(str)  # largura fixa, continua mapeável
+            np.save(os.path.join(pasta, col + '.npy'), arr)
+            tipos[col] = str(arr.dtype)
+        # meta.json por último: só existe quando todas as colunas foram gravadas
+        with open(os.path.join(pasta, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({'assinatura': list(assinatura), 'colunas': colunas, 'tipos': tipos}, f)
+    except OSError as e:
+        print(f"⚠️ Não foi possível gravar o cache colunar em '{pasta}': {e}")
+        return None
+    return _meta_cache(caminho, assinatura)
+
+def _abrir_coluna(caminho, col):
+    return np.load(os.path.join(_pasta_cache(caminho), col + '.npy'), mmap_mode='r')
+
+def _ler_cache(caminho, meta):
+    dados = {}
+    for col in meta['colunas']:
+        arr = _abrir_coluna(caminho, col)
+        dados[col] = pd.to_datetime(arr, unit='s').astype('datetime64[ns]') if col == 'date' else arr
+    return pd.DataFrame(dados)
+
+# ==========================
+# Carregamento
+
+def _enriquecer(df):
+    df['hour'] = df['date'].dt.hour
+    df['day_of_week'] = df['date'].dt.dayofweek
+    df['is_weekend'] = (df['day_of_week'] >= 5).astype(int)
+    return df
+
+def _ler_arquivo(caminho, assinatura):
+    meta = _meta_cache(caminho, assinatura)
+    if meta is not None:
+        return _enriquecer(_ler_cache(caminho, meta))
+    df = pd.read_csv(caminho)
+    df['date'] = pd.to_datetime(df['date']).astype('datetime64[ns]')
+    _gravar_cache(caminho, df, assinatura)
+    return _enriquecer(df)
+
+def carregar_dados(caminho=ARQUIVO_PADRAO, colunas_derivadas=True):
+    """Carrega o dataset uma única vez por processo e devolve uma visão somente leitura.
+
+    O CSV só é lido de novo quando o mtime ou o tamanho do arquivo mudam; nas execuções
+    seguintes o DataFrame é remontado a partir do cache colunar, sem parsing de texto.
+    Com colunas_derivadas=False a visão não traz 'hour', 'day_of_week' e 'is_weekend'.
+    Com Copy-on-Write a visão é uma cópia rasa; sem ele, uma cópia completa, para que
+    alterações feitas pelo chamador nunca cheguem ao DataFrame em cache.
+    """
+    chave = os.path.abspath(caminho)
+    assinatura = _assinatura(chave)  # FileNotFoundError se o arquivo não existir
+    entrada = _cache.get(chave)
+    if entrada is None or entrada[0] != assinatura:
+        entrada = (assinatura, _ler_arquivo(chave, assinatura))
+        _cache[chave] = entrada
+    df = entrada[1]
+    if not colunas_derivadas:
+        return df.drop(columns=COLUNAS_DERIVADAS)
+    return df.copy(deep=not _copy_on_write())
+
+def carregar_colunas(colunas=None, caminho=ARQUIVO_PADRAO):
+    """Devolve {coluna: array} mapeando em memória apenas as colunas pedidas.
+
+    Sem 'colunas', devolve todas as colunas numéricas. 'date' vem como int64 em segundos
+    desde a época. Os arrays são somente leitura.
+    """
+    chave = os.path.abspath(caminho)
+    assinatura = _assinatura(chave)
+    meta = _meta_cache(chave, assinatura)
+    if meta is None:
+        carregar_dados(caminho)  # lê o CSV e grava o cache colunar
+        meta = _meta_cache(chave, assinatura)
+    if meta is None:
+        # Cache indisponível (ex.: pasta sem permissão de escrita): usa o DataFrame em memória
+        df = carregar_dados(caminho, colunas_derivadas=False)
+        if colunas is None:
+            colunas = df.select_dtypes(include=[np.number]).columns
+        return {c: (df[c].to_numpy().astype('datetime64[s]').astype(np.int64) if c == 'date'
+                    else df[c].to_numpy()) for c in colunas}
+    if colunas is None:
+        colunas = [c for c in meta['colunas'] if c != 'date' and np.dtype(meta['tipos'][c]).kind in 'biuf']
+    return {c: _abrir_coluna(chave, c) for c in colunas}
+
+def ler_em_blocos(tamanho=10000, colunas=None, caminho=ARQUIVO_PADRAO):
+    """Gera DataFrames de até 'tamanho' linhas sem materializar o dataset inteiro.
+
+    Usa o cache colunar quando ele está válido (fatias dos arrays mapeados) e, caso
+    contrário, lê o CSV em pedaços. O índice de cada bloco é o número global da linha.
+    """
+    chave = os.path.abspath(caminho)
+    meta = _meta_cache(chave, _assinatura(chave))
+    if meta is not None:
+        if colunas is None:
+            colunas = meta['colunas']
+        arrays = {c: _abrir_coluna(chave, c) for c in colunas}
+        total = len(next(iter(arrays.values()))) if arrays else 0
+        for inicio in range(0, total, tamanho):
+            fim = min(inicio + tamanho, total)
+            bloco = {}
+            for c, arr in arrays.items():
+                fatia = arr[inicio:fim]
+                bloco[c] = pd.to_datetime(fatia, unit='s').astype('datetime64[ns]') if c == 'date' else fatia
+            yield pd.DataFrame(bloco, index=pd.RangeIndex(inicio, fim))
+        return
+    for bloco in pd.read_csv(chave, chunksize=tamanho, usecols=colunas):
+        if 'date' in bloco.columns:
+            bloco['date'] = pd.to_datetime(bloco['date']).astype('datetime64[ns]')
+        yield bloco
+
+def tipos_colunas(caminho=ARQUIVO_PADRAO, amostra=1000):
+    """Devolve {coluna: dtype} das colunas numéricas (sem 'date' e sem as derivadas), sem carregar os dados.
+
+    Usa os metadados do cache colunar quando ele está válido; senão, infere os tipos pelas
+    primeiras 'amostra' linhas do CSV.
+    """
+    chave = os.path.abspath(caminho)
+    meta = _meta_cache(chave, _assinatura(chave))  # FileNotFoundError se o arquivo não existir
+    if meta is not None:
+        tipos = {c: np.dtype(meta['tipos'][c]) for c in meta['colunas']}
+    else:
+        tipos = dict(pd.read_csv(chave, nrows=amostra).dtypes)
+    return {c: t for c, t in tipos.items() if c != 'date' and t.kind in 'biuf'}
+
+def colunas_numericas(caminho=ARQUIVO_PADRAO):
+    """Lista as colunas numéricas do dataset (sem as derivadas)"""
+    return list(tipos_colunas(caminho))
+
+def assinatura_arquivo(caminho=ARQUIVO_PADRAO):
+    """Identificação da versão atual do dataset (muda quando o arquivo é alterado)"""
+    return _assinatura(os.path.abspath(caminho))
+
+def limpar_cache():
+    """Descarta os DataFrames em cache (o próximo acesso relê o arquivo ou o cache colunar)"""
+    _cache.clear()
@@ -1,15 +1,11 @@
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from statsmodels.tsa.seasonal import seasonal_decompose
+from Dados import carregar_dados
 
-# Carregar o dataset uma única vez e processar colunas derivadas
-df = pd.read_csv('energydata_complete.csv')
-df['date'] = pd.to_datetime(df['date'])
-df['hour'] = df['date'].dt.hour
-df['day_of_week'] = df['date'].dt.dayofweek
-df['is_weekend'] = (df['day_of_week'] >= 5).astype(int)
+# Carregar o dataset (cache compartilhado, já com as colunas derivadas)
+df = carregar_dados()
 
 # Função de estatísticas descritivas
 def estatisticas_descritivas(df_numeric):
@@ -0,0 +1,889 @@
+import gc
+import math
+import random
+import threading
+import time
+import numpy as np
+
+# Teto de nível inicial das listas adaptativas (o mesmo max_lvl=4 usado antes)
+NIVEL_INICIAL = 4
+
+def nivel_adequado(n, P):
+    """Teto de nível para n chaves: log_{1/P}(n), nunca abaixo do NIVEL_INICIAL"""
+    if n < 2:
+        return NIVEL_INICIAL
+    return max(NIVEL_INICIAL, math.ceil(math.log(n) / math.log(1 / P)))
+
+def _preparar_ordenados(valores, max_lvl, P, aleatorio):
+    """Ordena e deduplica os valores (sem NaN) e sorteia o nível de cada um.
+
+    aleatorio=False usa níveis determinísticos: o i-ésimo valor (base 1) sobe um nível a cada
+    vez que i é divisível por round(1/P), como numa skip list perfeitamente balanceada.
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    valores = np.unique(valores[~np.isnan(valores)])
+    niveis, teto = _sortear_niveis(len(valores), max_lvl, P, aleatorio)
+    return valores, niveis, teto
+
+def _sortear_niveis(n, max_lvl, P, aleatorio):
+    """Níveis de n nós em ordem (ver _preparar_ordenados) e o teto usado"""
+    teto = nivel_adequado(n, P) if max_lvl is None else max_lvl
+    if aleatorio:
+        niveis = np.random.geometric(1 - P, size=n) - 1 if P > 0 else np.zeros(n, dtype=np.int64)
+    else:
+        base = max(2, round(1 / P))
+        niveis = np.zeros(n, dtype=np.int64)
+        posicao = np.arange(1, n + 1)
+        divisivel = posicao % base == 0
+        while divisivel.any():
+            niveis += divisivel
+            posicao //= np.where(divisivel, base, 1)
+            divisivel &= posicao % base == 0
+    return np.minimum(niveis, teto), teto
+
+# ----------------------------
+# Estrutura de Nó para Skip List
+class Node:
+    # Sem __dict__ por nó: só a chave e a lista de ponteiros
+    __slots__ = ('key', 'forward')
+
+    def __init__(self, key, level):
+        self.key = key
+        self.forward = [None] * (level + 1)
+
+# ----------------------------
+# Estrutura da Skip List
+# Com max_lvl=None o teto de nível acompanha o tamanho (log_{1/P}(n)) e o cabeçalho ganha
+# ponteiros conforme a lista cresce; com um inteiro o teto fica fixo, como antes.
+class SkipList:
+    def __init__(self, max_lvl=None, P=0.5):
+        self.adaptativo = max_lvl is None
+        self.MAXLVL = NIVEL_INICIAL if self.adaptativo else max_lvl
+        self.P = P
+        self.header = self.createNode(self.MAXLVL, None)
+        self.level = 0
+        self.count = 0
+
+    def _ajustar_teto(self):
+        if not self.adaptativo:
+            return
+        teto = nivel_adequado(self.count, self.P)
+        if teto > self.MAXLVL:
+            self.header.forward.extend([None] * (teto - self.MAXLVL))
+            self.MAXLVL = teto
+
+    def createNode(self, lvl, key):
+        return Node(key, lvl)
+
+    @classmethod
+    def from_sorted(cls, valores, max_lvl=None, P=0.5, aleatorio=True):
+        """Constrói a lista de uma vez em O(n): ordena com NumPy e liga todos os níveis numa
+        só passada, sem a busca que cada insertElement faz. As chaves viram float."""
+        valores, niveis, teto = _preparar_ordenados(valores, max_lvl, P, aleatorio)
+        lista = cls(max_lvl=max_lvl, P=P)
+        lista._ligar_ordenados(valores.tolist(), niveis, teto)
+        return lista
+
+    def _ligar_ordenados(self, chaves, niveis, teto):
+        # Liga numa lista vazia as chaves já ordenadas, com os níveis dados, numa só passada.
+        # De trás para frente: cada nó aponta para o último nó já criado em cada um dos seus níveis.
+        # O coletor cíclico fica pausado: milhares de nós novos o disparariam várias vezes à toa.
+        if teto > self.MAXLVL:
+            self.header.forward.extend([None] * (teto - self.MAXLVL))
+            self.MAXLVL = teto
+        ultimo = [None] * (teto + 1)
+        criar = self.createNode
+        coletor_ativo = gc.isenabled()
+        gc.disable()
+        try:
+            for key, lvl in zip(reversed(chaves), reversed(niveis.tolist())):
+                no = criar(lvl, key)
+                no.forward[:] = ultimo[:lvl + 1]
+                ultimo[:lvl + 1] = [no] * (lvl + 1)
+        finally:
+            if coletor_ativo:
+                gc.enable()
+        self.header.forward[:teto + 1] = ultimo
+        self.level = int(niveis.max()) if len(niveis) else 0
+        self.count = len(chaves)
+
+    def randomLevel(self):
+        lvl = 0
+        while random.random() < self.P and lvl < self.MAXLVL:
+            lvl += 1
+        return lvl
+
+    def insertElement(self, key):
+        update = [None] * (self.MAXLVL + 1)
+        current = self.header
+
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+            update[i] = current
+
+        current = current.forward[0]
+
+        if current is None or current.key != key:  # evitar repetidos
+            rlevel = self.randomLevel()
+            if rlevel > self.level:
+                for i in range(self.level + 1, rlevel + 1):
+                    update[i] = self.header
+                self.level = rlevel
+
+            n = self.createNode(rlevel, key)
+            for i in range(rlevel + 1):
+                n.forward[i] = update[i].forward[i]
+                update[i].forward[i] = n
+            self.count += 1
+            self._ajustar_teto()
+
+    def searchElement(self, key, verbose=False):
+        current = self.header
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+        current = current.forward[0]
+        if current and current.key == key:
+            if verbose:
+                pass  # Retirado o print
+            return True
+        else:
+            if verbose:
+                pass  # Retirado o print
+            return False
+
+    def search_many(self, valores):
+        """Pertinência em lote; devolve uma máscara bool na ordem de entrada.
+
+        As buscas são feitas em ordem crescente e cada uma recomeça do "dedo" deixado pela
+        anterior (o predecessor em cada nível): sobe só até o nível em que o próximo nó já
+        passa do valor e desce dali. Para sondas densas o custo total fica perto de uma
+        passada de merge pelo nível 0, em vez de uma descida completa por valor.
+        """
+        valores = np.asarray(valores, dtype=np.float64)
+        ordem = np.argsort(valores, kind='stable')
+        achados = np.zeros(len(valores), dtype=bool)
+        header = self.header
+        dedo = [header] * (self.level + 1)
+        for idx, key in zip(ordem.tolist(), valores[ordem].tolist()):
+            i = 0
+            while i < self.level and dedo[i].forward[i] and dedo[i].forward[i].key < key:
+                i += 1
+            current = dedo[i]
+            for j in range(i, -1, -1):
+                # Recomeça do mais adiantado entre o nó vindo de cima e o dedo deste nível
+                if current is header or (dedo[j] is not header and dedo[j].key > current.key):
+                    current = dedo[j]
+                while current.forward[j] and current.forward[j].key < key:
+                    current = current.forward[j]
+                dedo[j] = current
+            current = current.forward[0]
+            if current and current.key == key:
+                achados[idx] = True
+        return achados
+
+    def deleteElement(self, key):
+        update = [None] * (self.MAXLVL + 1)
+        current = self.header
+
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+            update[i] = current
+
+        current = current.forward[0]
+
+        if current and current.key == key:
+            for i in range(self.level + 1):
+                if update[i].forward[i] != current:
+                    continue
+                update[i].forward[i] = current.forward[i]
+
+            while self.level > 0 and self.header.forward[self.level] is None:
+                self.level -= 1
+            self.count -= 1
+            # Removido o print
+        else:
+            # Removido o print
+            pass
+
+    def extend(self, valores):
+        # Inserção em lote (ex.: um bloco vindo de ler_em_blocos); ignora NaN
+        for valor in valores:
+            if valor == valor:
+                self.insertElement(valor)
+
+    def updateElement(self, old_key, new_key):
+        if self.searchElement(old_key):
+            self.deleteElement(old_key)
+            self.insertElement(new_key)
+            # Removido o print
+        else:
+            # Removido o print
+            pass
+
+    def range(self, lo, hi):
+        """Itera em ordem as chaves com lo <= chave <= hi: desce até lo em O(log n) e segue o nível 0"""
+        current = self.header
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < lo:
+                current = current.forward[i]
+        current = current.forward[0]
+        while current and current.key <= hi:
+            yield current.key
+            current = current.forward[0]
+
+    def displayList(self):
+        # Removido o print da Skip List
+        pass
+
+# ----------------------------
+# Skip List em arrays (struct-of-arrays)
+# Os nós são índices: a chave fica num array float64 e os ponteiros de cada nível num array
+# int32 próprio (NULO = -1). O nó 0 é o cabeçalho; posições liberadas por remoções são reaproveitadas.
+class SkipListArray:
+    NULO = -1
+
+    def __init__(self, max_lvl=None, P=0.5, capacidade=1024):
+        self.adaptativo = max_lvl is None
+        self.MAXLVL = NIVEL_INICIAL if self.adaptativo else max_lvl
+        self.P = P
+        self.level = 0
+        self.count = 0
+        self._livres = []
+        self._proximo_id = 1  # o id 0 é o cabeçalho
+        self.chaves = np.zeros(0)
+        self.forward = [np.zeros(0, dtype=np.int32) for _ in range(self.MAXLVL + 1)]
+        self._alocar(max(2, capacidade))
+
+    def _alocar(self, capacidade):
+        # Cresce os arrays mantendo os nós existentes; as memoryviews são refeitas
+        usados = len(self.chaves)
+        chaves = np.zeros(capacidade)
+        chaves[:usados] = self.chaves
+        forward = []
+        for antigo in self.forward:
+            novo = np.full(capacidade, self.NULO, dtype=np.int32)
+            novo[:usados] = antigo
+            forward.append(novo)
+        self.chaves, self.forward = chaves, forward
+        self._chaves = memoryview(self.chaves)
+        self._forward = [memoryview(f) for f in self.forward]
+
+    @classmethod
+    def from_sorted(cls, valores, max_lvl=None, P=0.5, aleatorio=True):
+        """Constrói a lista de uma vez: ordena com NumPy e liga cada nível com uma atribuição
+        vetorizada (os nós de nível >= i, em ordem, apontam para o seguinte)."""
+        valores, niveis, teto = _preparar_ordenados(valores, max_lvl, P, aleatorio)
+        n = len(valores)
+        lista = cls(max_lvl=max_lvl, P=P, capacidade=n + 1)
+        while lista.MAXLVL < teto:
+            lista.forward.append(np.full(len(lista.chaves), cls.NULO, dtype=np.int32))
+            lista._forward.append(memoryview(lista.forward[-1]))
+            lista.MAXLVL += 1
+        lista.chaves[1:n + 1] = valores
+        for i in range(teto + 1):
+            nos = np.flatnonzero(niveis >= i) + 1
+            if not len(nos):
+                break
+            prox = lista.forward[i]
+            prox[0] = nos[0]
+            prox[nos[:-1]] = nos[1:]
+        lista.level = int(niveis.max()) if n else 0
+        lista.count = n
+        lista._proximo_id = n + 1
+        return lista
+
+    def _ajustar_teto(self):
+        # Um array de ponteiros a mais por nível novo
+        if not self.adaptativo:
+            return
+        teto = nivel_adequado(self.count, self.P)
+        while self.MAXLVL < teto:
+            self.forward.append(np.full(len(self.chaves), self.NULO, dtype=np.int32))
+            self._forward.append(memoryview(self.forward[-1]))
+            self.MAXLVL += 1
+
+    def _novo_no(self, key):
+        if self._livres:
+            no = self._livres.pop()
+        else:
+            if self._proximo_id == len(self.chaves):
+                self._alocar(2 * len(self.chaves))
+            no = self._proximo_id
+            self._proximo_id += 1
+        self._chaves[no] = key
+        return no
+
+    def randomLevel(self):
+        lvl = 0
+        while random.random() < self.P and lvl < self.MAXLVL:
+            lvl += 1
+        return lvl
+
+    def _predecessores(self, key):
+        # Último nó com chave < key em cada nível (o mesmo 'update' da SkipList);
+        # key chega como float Python: comparar com escalares NumPy é bem mais lento
+        chaves, forward = self._chaves, self._forward
+        update = [0] * (self.MAXLVL + 1)
+        atual = 0
+        for i in range(self.level, -1, -1):
+            prox = forward[i]
+            seguinte = prox[atual]
+            while seguinte != self.NULO and chaves[seguinte] < key:
+                atual = seguinte
+                seguinte = prox[atual]
+            update[i] = atual
+        return update
+
+    def insertElement(self, key):
+        key = float(key)
+        update = self._predecessores(key)
+        seguinte = self._forward[0][update[0]]
+        if seguinte != self.NULO and self._chaves[seguinte] == key:  # evitar repetidos
+            return
+        rlevel = self.randomLevel()
+        if rlevel > self.level:
+            for i in range(self.level + 1, rlevel + 1):
+                update[i] = 0
+            self.level = rlevel
+        no = self._novo_no(key)
+        for i in range(rlevel + 1):
+            prox = self._forward[i]
+            prox[no] = prox[update[i]]
+            prox[update[i]] = no
+        self.count += 1
+        self._ajustar_teto()
+
+    def searchElement(self, key, verbose=False):
+        key = float(key)
+        chaves, forward = self._chaves, self._forward
+        atual = 0
+        for i in range(self.level, -1, -1):
+            prox = forward[i]
+            seguinte = prox[atual]
+            while seguinte != self.NULO and chaves[seguinte] < key:
+                atual = seguinte
+                seguinte = prox[atual]
+        seguinte = forward[0][atual]
+        return seguinte != self.NULO and chaves[seguinte] == key
+
+    def search_many(self, valores):
+        """Pertinência em lote com busca por dedo (ver SkipList.search_many)"""
+        valores = np.asarray(valores, dtype=np.float64)
+        ordem = np.argsort(valores, kind='stable')
+        achados = np.zeros(len(valores), dtype=bool)
+        chaves, forward, nulo = self._chaves, self._forward, self.NULO
+        dedo = [0] * (self.level + 1)
+        for idx, key in zip(ordem.tolist(), valores[ordem].tolist()):
+            i = 0
+            while i < self.level:
+                seguinte = forward[i][dedo[i]]
+                if seguinte == nulo or chaves[seguinte] >= key:
+                    break
+                i += 1
+            atual = dedo[i]
+            for j in range(i, -1, -1):
+                if atual == 0 or (dedo[j] != 0 and chaves[dedo[j]] > chaves[atual]):
+                    atual = dedo[j]
+                prox = forward[j]
+                seguinte = prox[atual]
+                while seguinte != nulo and chaves[seguinte] < key:
+                    atual = seguinte
+                    seguinte = prox[atual]
+                dedo[j] = atual
+            seguinte = forward[0][atual]
+            if seguinte != nulo and chaves[seguinte] == key:
+                achados[idx] = True
+        return achados
+
+    def deleteElement(self, key):
+        key = float(key)
+        update = self._predecessores(key)
+        no = self._forward[0][update[0]]
+        if no == self.NULO or self._chaves[no] != key:
+            return
+        for i in range(self.level + 1):
+            prox = self._forward[i]
+            if prox[update[i]] != no:
+                continue
+            prox[update[i]] = prox[no]
+            prox[no] = self.NULO
+        while self.level > 0 and self._forward[self.level][0] == self.NULO:
+            self.level -= 1
+        self._livres.append(no)
+        self.count -= 1
+
+    def extend(self, valores):
+        # Inserção em lote (ex.: um bloco vindo de ler_em_blocos); ignora NaN
+        for valor in valores:
+            if valor == valor:
+                self.insertElement(valor)
+
+    def updateElement(self, old_key, new_key):
+        if self.searchElement(old_key):
+            self.deleteElement(old_key)
+            self.insertElement(new_key)
+
+    def range(self, lo, hi):
+        """Itera em ordem as chaves com lo <= chave <= hi"""
+        lo, hi = float(lo), float(hi)
+        chaves, prox = self._chaves, self._forward[0]
+        seguinte = prox[self._predecessores(lo)[0]]
+        while seguinte != self.NULO and chaves[seguinte] <= hi:
+            yield chaves[seguinte]
+            seguinte = prox[seguinte]
+
+    def displayList(self):
+        pass
+
+    def nbytes(self):
+        return self.chaves.nbytes + sum(f.nbytes for f in self.forward)
+
+# ----------------------------
+# Skip List indexável
+# Cada ponteiro guarda também o seu span: quantas posições ele pula no nível 0. Somando os spans
+# na descida sai a posição de qualquer chave (rank) e a k-ésima menor (select), ambos em O(log n).
+# Convenção: o cabeçalho está na posição 0 e um ponteiro para None pula até o fim (count - posição).
+class NoIndexavel(Node):
+    __slots__ = ('span',)
+
+    def __init__(self, key, level):
+        super().__init__(key, level)
+        self.span = [0] * (level + 1)
+
+class SkipListIndexavel(SkipList):
+    def createNode(self, lvl, key):
+        return NoIndexavel(key, lvl)
+
+    def _ajustar_teto(self):
+        super()._ajustar_teto()
+        falta = len(self.header.forward) - len(self.header.span)
+        if falta > 0:
+            self.header.span.extend([0] * falta)
+
+    @classmethod
+    def from_sorted(cls, valores, max_lvl=None, P=0.5, aleatorio=True):
+        """Como SkipList.from_sorted, mais uma passada pelo nível 0 para preencher os spans"""
+        lista = super().from_sorted(valores, max_lvl=max_lvl, P=P, aleatorio=aleatorio)
+        header = lista.header
+        header.span = [0] * len(header.forward)
+        ultimo_no = [header] * len(header.forward)
+        ultima_pos = [0] * len(header.forward)
+        pos, no = 1, header.forward[0]
+        while no:
+            for i in range(len(no.forward)):
+                ultimo_no[i].span[i] = pos - ultima_pos[i]
+                ultimo_no[i], ultima_pos[i] = no, pos
+            pos, no = pos + 1, no.forward[0]
+        for i in range(len(header.forward)):
+            ultimo_no[i].span[i] = lista.count - ultima_pos[i]
+        return lista
+
+    def insertElement(self, key):
+        update = [None] * (self.MAXLVL + 1)
+        posicao = [0] * (self.MAXLVL + 1)  # posição de update[i]
+        current = self.header
+
+        for i in range(self.level, -1, -1):
+            posicao[i] = posicao[i + 1] if i < self.level else 0
+            while current.forward[i] and current.forward[i].key < key:
+                posicao[i] += current.span[i]
+                current = current.forward[i]
+            update[i] = current
+
+        current = current.forward[0]
+
+        if current is None or current.key != key:  # evitar repetidos
+            rlevel = self.randomLevel()
+            if rlevel > self.level:
+                for i in range(self.level + 1, rlevel + 1):
+                    update[i] = self.header
+                    posicao[i] = 0
+                    self.header.span[i] = self.count
+                self.level = rlevel
+
+            n = self.createNode(rlevel, key)
+            for i in range(rlevel + 1):
+                n.forward[i] = update[i].forward[i]
+                update[i].forward[i] = n
+                n.span[i] = update[i].span[i] - (posicao[0] - posicao[i])
+                update[i].span[i] = posicao[0] - posicao[i] + 1
+            # Níveis acima do novo nó: o ponteiro que passa por cima dele pula uma posição a mais
+            for i in range(rlevel + 1, self.level + 1):
+                update[i].span[i] += 1
+            self.count += 1
+            self._ajustar_teto()
+
+    def deleteElement(self, key):
+        update = [None] * (self.MAXLVL + 1)
+        current = self.header
+
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+            update[i] = current
+
+        current = current.forward[0]
+
+        if current and current.key == key:
+            for i in range(self.level + 1):
+                if update[i].forward[i] is current:
+                    update[i].span[i] += current.span[i] - 1
+                    update[i].forward[i] = current.forward[i]
+                else:
+                    update[i].span[i] -= 1
+
+            while self.level > 0 and self.header.forward[self.level] is None:
+                self.level -= 1
+            self.count -= 1
+
+    def rank(self, key):
+        """Quantas chaves são menores que key (posição de key, a partir de 0, se ela existir)"""
+        current = self.header
+        posicao = 0
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                posicao += current.span[i]
+                current = current.forward[i]
+        return posicao
+
+    def select(self, k):
+        """k-ésima menor chave (k a partir de 0; negativo conta do fim, como em listas)"""
+        if k < 0:
+            k += self.count
+        if not 0 <= k < self.count:
+            raise IndexError("posição fora da skip list")
+        alvo = k + 1
+        current = self.header
+        posicao = 0
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and posicao + current.span[i] <= alvo:
+                posicao += current.span[i]
+                current = current.forward[i]
+            if posicao == alvo:
+                return current.key
+
+    def percentil(self, q):
+        """Percentil q (0-100) com interpolação linear entre vizinhos, como o np.percentile"""
+        if not self.count:
+            raise ValueError("skip list vazia")
+        pos = q / 100 * (self.count - 1)
+        k = int(pos)
+        baixo = self.select(k)
+        if k + 1 >= self.count:
+            return baixo
+        return baixo + (self.select(k + 1) - baixo) * (pos - k)
+
+    def mediana(self):
+        return self.percentil(50)
+
+    def __len__(self):
+        return self.count
+
+# ----------------------------
+# Skip List concorrente (lazy skip list, Herlihy et al.)
+# Leituras não usam trava: percorrem os ponteiros e só confiam em nós já totalmente ligados e não
+# marcados. Inserção e remoção travam apenas os predecessores envolvidos (uma trava por nó),
+# validam que nada mudou entre a busca e a trava e, se mudou, tentam de novo.
+# A remoção é lógica primeiro (marcado) e física depois. Sentinelas -inf/+inf dispensam testes de None.
+# O teto de nível é fixo (o cabeçalho não pode crescer com outras threads lendo): por padrão o
+# adequado para `capacidade` chaves.
+class NoConcorrente:
+    __slots__ = ('key', 'forward', 'trava', 'marcado', 'ligado', 'topo')
+
+    def __init__(self, key, level):
+        self.key = key
+        self.forward = [None] * (level + 1)
+        self.trava = threading.Lock()
+        self.marcado = False
+        self.ligado = False
+        self.topo = level
+
+class SkipListConcorrente:
+    def __init__(self, max_lvl=None, P=0.5, capacidade=10**6):
+        self.MAXLVL = nivel_adequado(capacidade, P) if max_lvl is None else max_lvl
+        self.P = P
+        self.header = NoConcorrente(-math.inf, self.MAXLVL)
+        self.tail = NoConcorrente(math.inf, self.MAXLVL)
+        self.header.forward = [self.tail] * (self.MAXLVL + 1)
+        self.header.ligado = self.tail.ligado = True
+        # Contagem aproximada em O(1): sem trava, incrementos simultâneos podem se perder;
+        # len() percorre a lista e dá o valor exato em O(n)
+        self.count = 0
+
+    def randomLevel(self):
+        lvl = 0
+        while random.random() < self.P and lvl < self.MAXLVL:
+            lvl += 1
+        return lvl
+
+    def _localizar(self, key, preds, succs):
+        # Preenche predecessores/sucessores em cada nível; devolve o nível mais alto em que key aparece (ou -1)
+        nivel_achado = -1
+        pred = self.header
+        for i in range(self.MAXLVL, -1, -1):
+            curr = pred.forward[i]
+            while key > curr.key:
+                pred = curr
+                curr = pred.forward[i]
+            if nivel_achado == -1 and key == curr.key:
+                nivel_achado = i
+            preds[i] = pred
+            succs[i] = curr
+        return nivel_achado
+
+    @staticmethod
+    def _travar(preds, topo):
+        # Trava cada predecessor distinto uma vez (o mesmo nó pode ser predecessor em vários níveis)
+        travados = []
+        anterior = None
+        for i in range(topo + 1):
+            if preds[i] is not anterior:
+                preds[i].trava.acquire()
+                travados.append(preds[i])
+                anterior = preds[i]
+        return travados
+
+    @staticmethod
+    def _destravar(travados):
+        for no in travados:
+            no.trava.release()
+
+    def insertElement(self, key):
+        """Insere key; devolve False se ela já estava na lista"""
+        key = float(key)
+        topo = self.randomLevel()
+        preds = [None] * (self.MAXLVL + 1)
+        succs = [None] * (self.MAXLVL + 1)
+        while True:
+            nivel_achado = self._localizar(key, preds, succs)
+            if nivel_achado != -1:
+                achado = succs[nivel_achado]
+                if not achado.marcado:
+                    # Outra thread está ligando esse nó: cede a vez (sleep(0) libera o GIL) até ela terminar
+                    while not achado.ligado:
+                        time.sleep(0)
+                    return False
+                continue  # está sendo removido: tenta de novo
+            travados = self._travar(preds, topo)
+            try:
+                valido = all(not preds[i].marcado and not succs[i].marcado and preds[i].forward[i] is succs[i]
+                             for i in range(topo + 1))
+                if not valido:
+                    continue
+                no = NoConcorrente(key, topo)
+                no.forward[:] = succs[:topo + 1]
+                for i in range(topo + 1):
+                    preds[i].forward[i] = no
+                no.ligado = True
+                self.count += 1
+                return True
+            finally:
+                self._destravar(travados)
+
+    def deleteElement(self, key):
+        """Remove key; devolve False se ela não estava na lista"""
+        key = float(key)
+        vitima = None
+        marcou = False
+        topo = -1
+        preds = [None] * (self.MAXLVL + 1)
+        succs = [None] * (self.MAXLVL + 1)
+        while True:
+            nivel_achado = self._localizar(key, preds, succs)
+            if not marcou:
+                if nivel_achado == -1:
+                    return False
+                vitima = succs[nivel_achado]
+                # Só remove nós totalmente ligados, achados no próprio topo e ainda não marcados
+                if not vitima.ligado or vitima.topo != nivel_achado or vitima.marcado:
+                    return False
+                topo = vitima.topo
+                vitima.trava.acquire()
+                if vitima.marcado:
+                    vitima.trava.release()
+                    return False
+                vitima.marcado = True  # remoção lógica: leitores já deixam de vê-lo
+                marcou = True
+            travados = self._travar(preds, topo)
+            try:
+                valido = all(not preds[i].marcado and preds[i].forward[i] is vitima for i in range(topo + 1))
+                if not valido:
+                    continue
+                for i in range(topo, -1, -1):
+                    preds[i].forward[i] = vitima.forward[i]
+                vitima.trava.release()
+                self.count -= 1
+                return True
+            finally:
+                self._destravar(travados)
+
+    def searchElement(self, key, verbose=False):
+        # Sem trava: um nó só conta se já está ligado e não foi marcado para remoção
+        key = float(key)
+        pred = self.header
+        for i in range(self.MAXLVL, -1, -1):
+            curr = pred.forward[i]
+            while key > curr.key:
+                pred = curr
+                curr = pred.forward[i]
+            if key == curr.key:
+                return curr.ligado and not curr.marcado
+        return False
+
+    def search_many(self, valores):
+        return np.array([self.searchElement(v) for v in valores], dtype=bool)
+
+    def range(self, lo, hi):
+        """Itera em ordem as chaves com lo <= chave <= hi (instantâneo fraco: ignora nós marcados)"""
+        lo, hi = float(lo), float(hi)
+        pred = self.header
+        for i in range(self.MAXLVL, -1, -1):
+            curr = pred.forward[i]
+            while lo > curr.key:
+                pred = curr
+                curr = pred.forward[i]
+        curr = pred.forward[0]
+        while curr is not self.tail and curr.key <= hi:
+            if curr.ligado and not curr.marcado:
+                yield curr.key
+            curr = curr.forward[0]
+
+    def extend(self, valores):
+        # Inserção em lote (ex.: um bloco vindo de ler_em_blocos); ignora NaN
+        for valor in valores:
+            if valor == valor:
+                self.insertElement(valor)
+
+    def updateElement(self, old_key, new_key):
+        # Remoção seguida de inserção: cada passo é atômico, o par não
+        if self.deleteElement(old_key):
+            self.insertElement(new_key)
+
+    def displayList(self):
+        pass
+
+    def __len__(self):
+        # Exato, mas O(n): percorre o nível 0 (use count para uma estimativa em O(1))
+        return sum(1 for _ in self.range(-math.inf, math.inf))
+
+# ----------------------------
+# Skip List temporal (multimapa)
+# Chave = instante da leitura (segundos desde a época, como o 'date' de carregar_colunas) e
+# valor = o id da linha (ou qualquer payload). Chaves repetidas são permitidas: leituras com o
+# mesmo instante ficam lado a lado, na ordem de chegada, e inserções fora de ordem (sensores
+# atrasados) caem direto na posição certa.
+class NoTemporal(Node):
+    __slots__ = ('valor',)
+
+    def __init__(self, key, level, valor=None):
+        super().__init__(key, level)
+        self.valor = valor
+
+class SkipListTemporal(SkipList):
+    def createNode(self, lvl, key, valor=None):
+        return NoTemporal(key, lvl, valor)
+
+    @classmethod
+    def from_sorted(cls, chaves, valores=None, max_lvl=None, P=0.5, aleatorio=True):
+        """Constrói o índice de uma vez; sem valores, o payload é a posição de cada chave (id da linha).
+
+        A ordenação é estável: chaves iguais mantêm a ordem de entrada. Nada é deduplicado.
+        """
+        chaves = np.asarray(chaves)
+        valores = np.arange(len(chaves)) if valores is None else np.asarray(valores)
+        ordem = np.argsort(chaves, kind='stable')
+        niveis, teto = _sortear_niveis(len(chaves), max_lvl, P, aleatorio)
+        lista = cls(max_lvl=max_lvl, P=P)
+        lista._ligar_ordenados(chaves[ordem].tolist(), niveis, teto)
+        no = lista.header.forward[0]
+        for valor in valores[ordem].tolist():
+            no.valor = valor
+            no = no.forward[0]
+        return lista
+
+    def insertElement(self, key, valor=None):
+        # Sempre insere; depois das leituras que já têm o mesmo instante
+        update = [None] * (self.MAXLVL + 1)
+        current = self.header
+
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key <= key:
+                current = current.forward[i]
+            update[i] = current
+
+        rlevel = self.randomLevel()
+        if rlevel > self.level:
+            for i in range(self.level + 1, rlevel + 1):
+                update[i] = self.header
+            self.level = rlevel
+
+        n = self.createNode(rlevel, key, valor)
+        for i in range(rlevel + 1):
+            n.forward[i] = update[i].forward[i]
+            update[i].forward[i] = n
+        self.count += 1
+        self._ajustar_teto()
+
+    def _remover(self, key, valor=None):
+        # Desliga a primeira leitura com essa chave (e esse valor, se dado); devolve o nó ou None
+        update = [None] * (self.MAXLVL + 1)
+        current = self.header
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+            update[i] = current
+
+        alvo = current.forward[0]
+        while alvo and alvo.key == key and valor is not None and alvo.valor != valor:
+            alvo = alvo.forward[0]
+        if alvo is None or alvo.key != key:
+            return None
+
+        for i in range(self.level + 1):
+            # Entre chaves repetidas o predecessor do alvo pode estar adiante de update[i]
+            p = update[i]
+            while p.forward[i] and p.forward[i] is not alvo and p.forward[i].key == key:
+                p = p.forward[i]
+            if p.forward[i] is alvo:
+                p.forward[i] = alvo.forward[i]
+
+        while self.level > 0 and self.header.forward[self.level] is None:
+            self.level -= 1
+        self.count -= 1
+        return alvo
+
+    def deleteElement(self, key, valor=None):
+        return self._remover(key, valor) is not None
+
+    def updateElement(self, old_key, new_key, valor=None):
+        # Move a leitura para outro instante, levando o payload junto
+        no = self._remover(old_key, valor)
+        if no is not None:
+            self.insertElement(new_key, no.valor)
+
+    def extend(self, chaves, valores=None):
+        if valores is None:
+            valores = [None] * len(chaves)
+        for key, valor in zip(chaves, valores):
+            self.insertElement(key, valor)
+
+    def get(self, key):
+        """Payloads de todas as leituras com essa chave, na ordem de chegada"""
+        return [valor for _, valor in self.range(key, key)]
+
+    def range(self, lo, hi):
+        """Itera em ordem os pares (chave, valor) com lo <= chave <= hi"""
+        current = self.header
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < lo:
+                current = current.forward[i]
+        current = current.forward[0]
+        while current and current.key <= hi:
+            yield current.key, current.valor
+            current = current.forward[0]
+
+    def __len__(self):
+        return self.count
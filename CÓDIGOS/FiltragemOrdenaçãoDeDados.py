@@ -1,12 +1,9 @@
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from Dados import carregar_dados
 
-# ✅ Carregar dados
-data = pd.read_csv('energydata_complete.csv')
-
-# ✅ Conversão de 'date'
-data['date'] = pd.to_datetime(data['date'])
+# ✅ Carregar dados ('date' já convertida pelo carregador compartilhado)
+data = carregar_dados(colunas_derivadas=False)
 
 # ✅ Seleção de colunas numéricas + data
 cols_numericas = data.select_dtypes(include=[np.number]).columns.tolist()
@@ -0,0 +1,479 @@
+import os
+import hashlib
+import math
+import struct
+import numpy as np
+
+# Esquemas de hash disponíveis para as k posições de cada item
+#   'duplo'  -> um digest de 128 bits por item (duas metades h1, h2) e posições h1 + i*h2 (Kirsch–Mitzenmacher)
+#   'sha256' -> k chamadas de SHA256 sobre str(item) + str(i) (esquema original)
+ESQUEMAS = ['duplo', 'sha256']
+
+_MASCARA64 = (1 << 64) - 1
+_C1 = 0xBF58476D1CE4E5B9
+_C2 = 0x94D049BB133111EB
+_OURO = 0x9E3779B97F4A7C15
+# Mesmas sementes do modo 'hash128' de HashLinhas
+_SEMENTES = (0x243F6A8885A308D3, 0x13198A2E03707344)
+_INICIO = tuple(((s ^ 1) + _OURO) & _MASCARA64 for s in _SEMENTES)
+_FLOAT64 = struct.Struct('<d')
+_UINT64 = struct.Struct('<Q')
+
+def _misturar(x):
+    # Finalizador do splitmix64 em inteiros Python
+    x = ((x ^ (x >> 30)) * _C1) & _MASCARA64
+    x = ((x ^ (x >> 27)) * _C2) & _MASCARA64
+    return x ^ (x >> 31)
+
+def _bits_item(item):
+    # Números pelos 8 bytes crus do float64; qualquer outra coisa pelos 8 primeiros bytes de um BLAKE2b
+    if isinstance(item, (int, float, np.integer, np.floating)):
+        return _UINT64.unpack(_FLOAT64.pack(item))[0]
+    digest = hashlib.blake2b(str(item).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+def digest128(item):
+    """Digest de 128 bits de um item, como o par (h1, h2) de 64 bits"""
+    x = _bits_item(item)
+    return _misturar(_INICIO[0] ^ x), _misturar(_INICIO[1] ^ x)
+
+def _misturar_lote(x):
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(_C1)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(_C2)
+    return x ^ (x >> np.uint64(31))
+
+def digest128_lote(valores):
+    """digest128 de um array de números inteiro, sobre os 8 bytes crus de cada float64"""
+    x = np.ascontiguousarray(valores, dtype=np.float64).view(np.uint64)
+    return _misturar_lote(np.uint64(_INICIO[0]) ^ x), _misturar_lote(np.uint64(_INICIO[1]) ^ x)
+
+def _palavras_alinhadas(n_palavras):
+    # Array uint64 começando numa fronteira de 64 bytes (início de linha de cache)
+    buffer = np.zeros(n_palavras + 8, dtype=np.uint64)
+    inicio = (-buffer.ctypes.data % 64) // 8
+    return buffer[inicio:inicio + n_palavras]
+
+# ==========================
+# Persistência: arquivo binário com um cabeçalho de 64 bytes seguido das palavras cruas,
+# reaberto com np.memmap (nada é lido até a primeira consulta). O cabeçalho guarda o digest
+# da assinatura dos dados de origem; se ela mudar, load devolve None e o filtro é reconstruído.
+_MAGICO = b'BLOOMF01'
+_CABECALHO = struct.Struct('<8sBBBxIQ32s')  # mágico, classe, esquema, blocado, k, size, assinatura
+_MAGICO_ESCALAVEL = b'SBLOOM01'
+_CABECALHO_ESCALAVEL = struct.Struct('<8sQdddB3xI32s')  # + capacidade inicial, taxa, crescimento, razão, blocado, nº de sub-filtros
+_SUB_FILTRO = struct.Struct('<QQ')  # capacidade e itens inseridos de cada sub-filtro
+_ALINHAMENTO = 64
+
+def _digest_assinatura(assinatura):
+    if assinatura is None:
+        return bytes(32)
+    return hashlib.blake2b(repr(assinatura).encode('utf-8'), digest_size=32).digest()
+
+def _completar(arquivo):
+    # Preenche com zeros até a próxima fronteira de 64 bytes
+    arquivo.write(bytes(-arquivo.tell() % _ALINHAMENTO))
+
+def _gravar_atomico(caminho, escrever):
+    # Grava num temporário e renomeia: um arquivo pela metade nunca é aberto
+    temporario = caminho + '.tmp'
+    with open(temporario, 'wb') as arquivo:
+        escrever(arquivo)
+    os.replace(temporario, caminho)
+
+# ----------------------------
+# Estrutura de Bloom Filter
+# Com blocado=True os k bits de cada item ficam num único bloco de 64 bytes (uma linha de cache):
+# h1 escolhe o bloco e h2 as k posições dentro dele. Cada busca toca uma linha de cache em vez
+# de k, ao custo de uma taxa de falso positivo um pouco maior para o mesmo tamanho.
+class BloomFilter:
+    BITS_BLOCO = 512
+    _POR_PALAVRA = 64  # posições guardadas em cada palavra uint64
+    _CLASSE = 0        # código da classe no arquivo salvo
+
+    def __init__(self, size, hash_count, esquema='duplo', blocado=False):
+        if esquema not in ESQUEMAS:
+            raise ValueError(f"Esquema de hash desconhecido: '{esquema}' (use um de {ESQUEMAS})")
+        if blocado and esquema != 'duplo':
+            raise ValueError("O filtro blocado só está disponível no esquema 'duplo'")
+        if blocado:
+            size = -(-size // self.BITS_BLOCO) * self.BITS_BLOCO  # múltiplo inteiro de blocos
+            self.n_blocos = size // self.BITS_BLOCO
+        self.size = size
+        self.hash_count = hash_count
+        self.esquema = esquema
+        self.blocado = blocado
+        # Bits em palavras uint64 (bit i = bit i % 64 da palavra i // 64); a memoryview
+        # serve o caminho escalar e o array NumPy as operações em lote
+        self.palavras = _palavras_alinhadas(-(-size // self._POR_PALAVRA))
+        self._palavras = memoryview(self.palavras)
+
+    def _hashes(self, item):
+        if self.blocado:
+            h1, h2 = digest128(item)
+            base = (h1 % self.n_blocos) * self.BITS_BLOCO
+            # Passo ímpar módulo BITS_BLOCO (potência de 2): as k posições no bloco são sempre distintas
+            mascara = self.BITS_BLOCO - 1
+            posicao, passo = h2 & mascara, (h2 >> mascara.bit_length()) | 1
+            return [base + ((posicao + i * passo) & mascara) for i in range(self.hash_count)]
+        if self.esquema == 'duplo':
+            # Um único digest: as k posições são h1, h1 + h2, h1 + 2*h2, ... (mod size)
+            h1, h2 = digest128(item)
+            size = self.size
+            # Passo nunca nulo: senão as k posições cairiam todas no mesmo bit
+            posicao, passo = h1 % size, h2 % max(size - 1, 1) + 1
+            hashes = []
+            for _ in range(self.hash_count):
+                hashes.append(posicao)
+                posicao = (posicao + passo) % size
+            return hashes
+        hashes = []
+        item_str = str(item).encode('utf-8')
+        for i in range(self.hash_count):
+            hash_result = int(hashlib.sha256(item_str + str(i).encode()).hexdigest(), 16)
+            hashes.append(hash_result % self.size)
+        return hashes
+
+    def add(self, item):
+        palavras = self._palavras
+        for hash_val in self._hashes(item):
+            palavras[hash_val >> 6] |= 1 << (hash_val & 63)
+
+    def check(self, item):
+        palavras = self._palavras
+        for hash_val in self._hashes(item):
+            if not (palavras[hash_val >> 6] >> (hash_val & 63)) & 1:
+                return False
+        return True
+
+    def extend(self, itens):
+        # Inserção em lote (ex.: um bloco vindo de ler_em_blocos)
+        for item in itens:
+            self.add(item)
+
+    # ----------------------------
+    # Persistência
+
+    def _gravar(self, arquivo, assinatura=None):
+        arquivo.write(_CABECALHO.pack(_MAGICO, self._CLASSE, ESQUEMAS.index(self.esquema), self.blocado,
+                                      self.hash_count, self.size, _digest_assinatura(assinatura)))
+        _completar(arquivo)
+        self.palavras.tofile(arquivo)
+        _completar(arquivo)
+
+    def save(self, caminho, assinatura=None):
+        """Salva o filtro (bits, m, k e esquema de hash) num arquivo binário compacto"""
+        _gravar_atomico(caminho, lambda arquivo: self._gravar(arquivo, assinatura))
+
+    @staticmethod
+    def _mapear(caminho, inicio, assinatura=None):
+        # Devolve (filtro, posição do fim no arquivo) ou (None, None) se o arquivo não serve
+        with open(caminho, 'rb') as arquivo:
+            arquivo.seek(inicio)
+            cabecalho = arquivo.read(_CABECALHO.size)
+        if len(cabecalho) < _CABECALHO.size:
+            return None, None
+        magico, classe, esquema, blocado, hash_count, size, digest = _CABECALHO.unpack(cabecalho)
+        if magico != _MAGICO or classe not in _CLASSES or esquema >= len(ESQUEMAS):
+            return None, None
+        if assinatura is not None and digest != _digest_assinatura(assinatura):
+            return None, None
+        cls = _CLASSES[classe]
+        filtro = cls.__new__(cls)
+        filtro.size = size
+        filtro.hash_count = hash_count
+        filtro.esquema = ESQUEMAS[esquema]
+        filtro.blocado = bool(blocado)
+        if filtro.blocado:
+            filtro.n_blocos = size // cls.BITS_BLOCO
+        n_palavras = -(-size // cls._POR_PALAVRA)
+        dados = inicio + _ALINHAMENTO
+        # Cópia na escrita: consultas leem direto do arquivo e inserções não alteram o disco
+        filtro.palavras = np.memmap(caminho, dtype=np.uint64, mode='c', offset=dados, shape=(n_palavras,))
+        filtro._palavras = memoryview(filtro.palavras)
+        fim = dados + n_palavras * 8
+        return filtro, fim + (-fim % _ALINHAMENTO)
+
+    @classmethod
+    def load(cls, caminho, assinatura=None):
+        """Reabre um filtro salvo, mapeado em memória; None se não existir ou a assinatura mudou"""
+        try:
+            filtro, _ = BloomFilter._mapear(caminho, 0, assinatura)
+        except (OSError, ValueError):
+            return None
+        if filtro is not None and not isinstance(filtro, cls):
+            return None
+        return filtro
+
+    # ----------------------------
+    # Operações em lote (esquema 'duplo'): hashing vetorizado sobre os bytes crus dos floats
+    # e todas as k*n posições escritas ou lidas de uma vez nas palavras
+
+    def _posicoes_lote(self, valores):
+        # Matriz (n, k) com as mesmas posições que _hashes calcula item a item
+        h1, h2 = digest128_lote(valores)
+        deslocamentos = np.arange(self.hash_count, dtype=np.uint64)
+        if self.blocado:
+            base = (h1 % np.uint64(self.n_blocos)) * np.uint64(self.BITS_BLOCO)
+            mascara = np.uint64(self.BITS_BLOCO - 1)
+            posicao, passo = h2 & mascara, (h2 >> np.uint64((self.BITS_BLOCO - 1).bit_length())) | np.uint64(1)
+            return base[:, None] + ((posicao[:, None] + deslocamentos * passo[:, None]) & mascara)
+        size = np.uint64(self.size)
+        posicao = h1 % size
+        passo = h2 % np.uint64(max(self.size - 1, 1)) + np.uint64(1)
+        return (posicao[:, None] + deslocamentos * passo[:, None]) % size
+
+    def add_many(self, valores):
+        """Insere um array de números de uma vez"""
+        if self.esquema != 'duplo':
+            self.extend(valores)
+            return
+        posicoes = self._posicoes_lote(valores).ravel()
+        np.bitwise_or.at(self.palavras, posicoes >> np.uint64(6),
+                         np.uint64(1) << (posicoes & np.uint64(63)))
+
+    def check_many(self, valores):
+        """Verifica um array de números de uma vez; devolve a máscara de 'possivelmente presentes'"""
+        if self.esquema != 'duplo':
+            return np.array([self.check(v) for v in valores], dtype=bool)
+        posicoes = self._posicoes_lote(valores)
+        bits = (self.palavras[posicoes >> np.uint64(6)] >> (posicoes & np.uint64(63))) & np.uint64(1)
+        return bits.all(axis=1)
+
+# ----------------------------
+# Bloom Filter escalável: não precisa saber N antes das inserções
+# Encadeia sub-filtros cada vez maiores (capacidade x crescimento) com taxas de erro cada vez
+# menores (x razao); a soma das taxas converge para taxa_fp, então o falso positivo total
+# continua dentro do alvo enquanto os dados chegam.
+def _parametros(capacidade, taxa_fp):
+    m = math.ceil(- capacidade * math.log(taxa_fp) / (math.log(2) ** 2))
+    k = max(1, round(- math.log2(taxa_fp)))
+    return m, k
+
+class ScalableBloomFilter:
+    def __init__(self, capacidade_inicial=1000, taxa_fp=0.01, crescimento=2, razao=0.85, esquema='duplo',
+                 blocado=False):
+        if not 0 < razao < 1:
+            raise ValueError("razao deve estar entre 0 e 1")
+        self.capacidade_inicial = capacidade_inicial
+        self.taxa_fp = taxa_fp
+        self.crescimento = crescimento
+        self.razao = razao
+        self.esquema = esquema
+        self.blocado = blocado
+        self.filtros = []  # lista de [BloomFilter, capacidade, itens inseridos]
+        self._novo_filtro()
+
+    def _novo_filtro(self):
+        i = len(self.filtros)
+        capacidade = int(self.capacidade_inicial * self.crescimento ** i)
+        # taxa_fp * (1 - razao) * razao^i: a série geométrica soma taxa_fp
+        taxa = self.taxa_fp * (1 - self.razao) * self.razao ** i
+        m, k = _parametros(capacidade, taxa)
+        self.filtros.append([BloomFilter(m, k, esquema=self.esquema, blocado=self.blocado), capacidade, 0])
+
+    def add(self, item):
+        # Itens que já parecem presentes não ocupam capacidade de novo
+        if self.check(item):
+            return
+        atual = self.filtros[-1]
+        if atual[2] >= atual[1]:
+            self._novo_filtro()
+            atual = self.filtros[-1]
+        atual[0].add(item)
+        atual[2] += 1
+
+    def check(self, item):
+        return any(filtro.check(item) for filtro, _, _ in self.filtros)
+
+    def extend(self, itens):
+        for item in itens:
+            self.add(item)
+
+    def add_many(self, valores):
+        """Insere um array de números, abrindo novos sub-filtros conforme a capacidade acaba"""
+        valores = np.unique(np.asarray(valores, dtype=np.float64))
+        valores = valores[~self.check_many(valores)]
+        while len(valores):
+            atual = self.filtros[-1]
+            livre = atual[1] - atual[2]
+            if livre <= 0:
+                self._novo_filtro()
+                continue
+            atual[0].add_many(valores[:livre])
+            atual[2] += min(livre, len(valores))
+            valores = valores[livre:]
+
+    def check_many(self, valores):
+        valores = np.asarray(valores, dtype=np.float64)
+        presentes = np.zeros(len(valores), dtype=bool)
+        for filtro, _, _ in self.filtros:
+            presentes |= filtro.check_many(valores)
+        return presentes
+
+    def __len__(self):
+        return sum(inseridos for _, _, inseridos in self.filtros)
+
+    def nbytes(self):
+        return sum(filtro.palavras.nbytes for filtro, _, _ in self.filtros)
+
+    def save(self, caminho, assinatura=None):
+        """Salva todos os sub-filtros num único arquivo (cada um alinhado em 64 bytes)"""
+        def escrever(arquivo):
+            arquivo.write(_CABECALHO_ESCALAVEL.pack(
+                _MAGICO_ESCALAVEL, self.capacidade_inicial, self.taxa_fp, self.crescimento, self.razao,
+                self.blocado, len(self.filtros), _digest_assinatura(assinatura)))
+            for _, capacidade, inseridos in self.filtros:
+                arquivo.write(_SUB_FILTRO.pack(capacidade, inseridos))
+            _completar(arquivo)
+            for filtro, _, _ in self.filtros:
+                filtro._gravar(arquivo)
+        _gravar_atomico(caminho, escrever)
+
+    @classmethod
+    def load(cls, caminho, assinatura=None):
+        """Reabre um filtro escalável salvo, com os sub-filtros mapeados em memória"""
+        try:
+            with open(caminho, 'rb') as arquivo:
+                cabecalho = arquivo.read(_CABECALHO_ESCALAVEL.size)
+                if len(cabecalho) < _CABECALHO_ESCALAVEL.size:
+                    return None
+                magico, capacidade_inicial, taxa_fp, crescimento, razao, blocado, n_filtros, digest = \
+                    _CABECALHO_ESCALAVEL.unpack(cabecalho)
+                if magico != _MAGICO_ESCALAVEL:
+                    return None
+                if assinatura is not None and digest != _digest_assinatura(assinatura):
+                    return None
+                tabela = [_SUB_FILTRO.unpack(arquivo.read(_SUB_FILTRO.size)) for _ in range(n_filtros)]
+                posicao = arquivo.tell()
+            escalavel = cls.__new__(cls)
+            escalavel.capacidade_inicial = capacidade_inicial
+            escalavel.taxa_fp = taxa_fp
+            escalavel.crescimento = crescimento
+            escalavel.razao = razao
+            escalavel.blocado = bool(blocado)
+            escalavel.filtros = []
+            posicao += -posicao % _ALINHAMENTO
+            for capacidade, inseridos in tabela:
+                filtro, posicao = BloomFilter._mapear(caminho, posicao)
+                if filtro is None:
+                    return None
+                escalavel.filtros.append([filtro, capacidade, inseridos])
+            # O esquema de hash vem gravado em cada sub-filtro
+            escalavel.esquema = escalavel.filtros[0][0].esquema if escalavel.filtros else 'duplo'
+        except (OSError, ValueError, struct.error):
+            return None
+        return escalavel
+
+# ----------------------------
+# Bloom Filter com contadores: permite remover valores e combinar filtros
+# Cada posição guarda um contador de 4 bits (16 por palavra uint64) em vez de um bit.
+# Os contadores saturam em 15 e, saturados, não são mais decrementados (ficam como bits fixos),
+# então remover nunca cria falso negativo. União soma os contadores e interseção usa o mínimo;
+# os dois filtros precisam dos mesmos parâmetros, e nenhum valor é re-hasheado.
+# No modo blocado o bloco tem 128 contadores: 128 * 4 bits = 64 bytes, a mesma linha de cache.
+class CountingBloomFilter(BloomFilter):
+    BITS_BLOCO = 128
+    MAXIMO = 15
+    _POR_PALAVRA = 16
+    _CLASSE = 1
+
+    def _contador(self, posicao):
+        return (self._palavras[posicao >> 4] >> ((posicao & 15) * 4)) & 15
+
+    def add(self, item):
+        palavras = self._palavras
+        for posicao in self._hashes(item):
+            deslocamento = (posicao & 15) * 4
+            if (palavras[posicao >> 4] >> deslocamento) & 15 < self.MAXIMO:
+                palavras[posicao >> 4] += 1 << deslocamento
+
+    def check(self, item):
+        for posicao in self._hashes(item):
+            if not self._contador(posicao):
+                return False
+        return True
+
+    def remove(self, item):
+        """Remove um valor inserido antes; devolve False se ele com certeza não está no filtro"""
+        if not self.check(item):
+            return False
+        palavras = self._palavras
+        for posicao in self._hashes(item):
+            deslocamento = (posicao & 15) * 4
+            if (palavras[posicao >> 4] >> deslocamento) & 15 < self.MAXIMO:
+                palavras[posicao >> 4] -= 1 << deslocamento
+        return True
+
+    # ----------------------------
+    # Contadores desempacotados (um uint8 por posição) para as operações em lote:
+    # o contador i fica no nibble baixo (i par) ou alto (i ímpar) do byte i // 2
+
+    def contadores(self):
+        bytes_ = self.palavras.view(np.uint8)
+        contadores = np.empty(2 * len(bytes_), dtype=np.uint8)
+        contadores[0::2] = bytes_ & 15
+        contadores[1::2] = bytes_ >> 4
+        return contadores[:self.size]
+
+    def _gravar_contadores(self, contadores):
+        completos = np.zeros(2 * self.palavras.nbytes, dtype=np.uint8)
+        completos[:self.size] = contadores
+        self.palavras.view(np.uint8)[:] = completos[0::2] | (completos[1::2] << 4)
+
+    def _somar(self, valores, sinal):
+        # Só as palavras tocadas: lê o nibble de cada posição, satura em 0..MAXIMO e soma a
+        # diferença deslocada na palavra (várias posições da mesma palavra acumulam via add.at)
+        posicoes, repeticoes = np.unique(self._posicoes_lote(valores), return_counts=True)
+        indices = posicoes >> np.uint64(4)
+        deslocamentos = (posicoes & np.uint64(15)) * np.uint64(4)
+        atuais = ((self.palavras[indices] >> deslocamentos) & np.uint64(15)).astype(np.int64)
+        novos = np.clip(atuais + sinal * repeticoes, 0, self.MAXIMO)
+        novos = np.where(atuais == self.MAXIMO, self.MAXIMO, novos)
+        diferencas = (novos - atuais).astype(np.uint64) << deslocamentos  # negativas em complemento de 2
+        np.add.at(self.palavras, indices, diferencas)
+
+    def add_many(self, valores):
+        if self.esquema != 'duplo':
+            self.extend(valores)
+            return
+        self._somar(valores, 1)
+
+    def check_many(self, valores):
+        if self.esquema != 'duplo':
+            return np.array([self.check(v) for v in valores], dtype=bool)
+        posicoes = self._posicoes_lote(valores)
+        deslocamentos = (posicoes & np.uint64(15)) * np.uint64(4)
+        return ((self.palavras[posicoes >> np.uint64(4)] >> deslocamentos) & np.uint64(15) > 0).all(axis=1)
+
+    def remove_many(self, valores):
+        """Remove um array de valores; devolve a máscara dos que estavam (possivelmente) presentes"""
+        valores = np.asarray(valores, dtype=np.float64)
+        presentes = self.check_many(valores)
+        if self.esquema != 'duplo':
+            for v in valores[presentes]:
+                self.remove(v)
+        elif presentes.any():
+            self._somar(valores[presentes], -1)
+        return presentes
+
+    def _combinar(self, outro, funcao):
+        if (self.size, self.hash_count, self.esquema, self.blocado) != \
+                (outro.size, outro.hash_count, outro.esquema, outro.blocado):
+            raise ValueError("Os filtros precisam ter o mesmo tamanho, número de hashes, esquema e blocagem")
+        resultado = CountingBloomFilter(self.size, self.hash_count, self.esquema, self.blocado)
+        resultado._gravar_contadores(funcao(self.contadores(), outro.contadores()))
+        return resultado
+
+    def union(self, outro):
+        return self._combinar(outro, lambda a, b: np.minimum(a.astype(np.int16) + b, self.MAXIMO).astype(np.uint8))
+
+    def intersection(self, outro):
+        return self._combinar(outro, np.minimum)
+
+    def __or__(self, outro):
+        return self.union(outro)
+
+    def __and__(self, outro):
+        return self.intersection(outro)
+
+_CLASSES = {BloomFilter._CLASSE: BloomFilter, CountingBloomFilter._CLASSE: CountingBloomFilter}
@@ -1,7 +1,7 @@
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import networkx as nx
+from Dados import carregar_dados
 
 # =========================
 # Funções para estrutura de dados (grafo)
@@ -64,8 +64,7 @@ class MeuGrafo:
 
 # =========================
 # Carregar e preparar dados
-data = pd.read_csv('energydata_complete.csv')
-data['date'] = pd.to_datetime(data['date'])
+data = carregar_dados(colunas_derivadas=False)
 cols_numericas = data.select_dtypes(include=[np.number]).columns.tolist()
 cols_utilizadas = ['date'] + cols_numericas
 df = data[cols_utilizadas]
@@ -0,0 +1,167 @@
+import os
+import time
+import hashlib
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# Modos de fingerprint disponíveis e o tipo da chave devolvida
+#   'hash64'  -> uint64            (não criptográfico, 8 bytes por linha)
+#   'hash128' -> bytes de 16 (S16) (não criptográfico, duas sementes independentes)
+#   'sha256'  -> bytes de 32 (S32) (criptográfico, para compatibilidade)
+MODOS = ['hash64', 'hash128', 'sha256']
+_LARGURA = {'hash128': 16, 'sha256': 32}
+_TIPO_CHAVE = {'hash64': np.uint64, 'hash128': 'S16', 'sha256': 'S32'}
+
+_C1 = np.uint64(0xBF58476D1CE4E5B9)
+_C2 = np.uint64(0x94D049BB133111EB)
+_OURO = np.uint64(0x9E3779B97F4A7C15)
+_SEMENTES = (np.uint64(0x243F6A8885A308D3), np.uint64(0x13198A2E03707344))
+
+def matriz_linhas(dados):
+    """Converte um DataFrame (ou array 2D) numa matriz uint64 contígua, uma linha por registro.
+
+    Cada célula vira os seus 8 bytes crus: floats e inteiros pelo valor binário,
+    datas como int64 (ns desde a época) e colunas de texto pelo hash do pandas.
+    """
+    if isinstance(dados, np.ndarray):
+        dados = pd.DataFrame(dados)
+    colunas = []
+    for col in dados.columns:
+        valores = dados[col].to_numpy()
+        if valores.dtype.kind == 'M':
+            valores = valores.astype('datetime64[ns]').view(np.int64)
+        elif valores.dtype.kind in 'biu':
+            valores = valores.astype(np.int64)
+        elif valores.dtype.kind == 'f':
+            valores = valores.astype(np.float64)
+        else:
+            valores = pd.util.hash_array(valores.astype(str))
+        colunas.append(valores.view(np.uint64))
+    if not colunas:
+        return np.zeros((len(dados), 0), dtype=np.uint64)
+    return np.ascontiguousarray(np.column_stack(colunas))
+
+def _misturar(x):
+    # Finalizador do splitmix64: espalha cada bit de entrada por toda a palavra
+    x = x ^ (x >> np.uint64(30))
+    x = x * _C1
+    x = x ^ (x >> np.uint64(27))
+    x = x * _C2
+    return x ^ (x >> np.uint64(31))
+
+def _hash64(matriz, semente):
+    n, n_colunas = matriz.shape
+    h = np.full(n, semente ^ np.uint64(n_colunas), dtype=np.uint64)
+    for j in range(n_colunas):
+        h = _misturar((h + _OURO) ^ matriz[:, j])
+    return h
+
+def fingerprint_linhas(dados, modo='hash64'):
+    """Calcula o fingerprint de todas as linhas de uma vez, direto dos bytes da matriz.
+
+    Devolve um array de chaves de largura fixa (ver MODOS) na mesma ordem das linhas.
+    """
+    return _fingerprint_matriz(matriz_linhas(dados), modo)
+
+def _fingerprint_matriz(matriz, modo):
+    if modo == 'hash64':
+        return _hash64(matriz, _SEMENTES[0])
+    if modo == 'hash128':
+        pares = np.column_stack([_hash64(matriz, s) for s in _SEMENTES])
+        return np.ascontiguousarray(pares).view('S16').ravel()
+    if modo == 'sha256':
+        digests = np.empty(len(matriz), dtype='S32')
+        for i, linha in enumerate(matriz):
+            digests[i] = hashlib.sha256(linha.tobytes()).digest()
+        return digests
+    raise ValueError(f"Modo de hash desconhecido: '{modo}' (use um de {MODOS})")
+
+# ==========================
+# Modo paralelo: blocos de linhas em processos, com a matriz em memória compartilhada
+# (os processos só recebem o nome do segmento e o intervalo, nenhuma linha é serializada).
+# No Windows o processo principal precisa estar protegido por if __name__ == "__main__",
+# como em Main.py.
+
+def _trabalhador(nome_entrada, forma, nome_saida, modo, inicio, fim):
+    inicio_t = time.perf_counter()
+    entrada = shared_memory.SharedMemory(name=nome_entrada)
+    saida = shared_memory.SharedMemory(name=nome_saida)
+    try:
+        matriz = np.ndarray(forma, dtype=np.uint64, buffer=entrada.buf)
+        chaves = np.ndarray((forma[0],), dtype=_TIPO_CHAVE[modo], buffer=saida.buf)
+        chaves[inicio:fim] = _fingerprint_matriz(matriz[inicio:fim], modo)
+        del matriz, chaves  # libera as visões antes de fechar os segmentos
+    finally:
+        entrada.close()
+        saida.close()
+    return os.getpid(), fim - inicio, time.perf_counter() - inicio_t
+
+def fingerprint_linhas_paralelo(dados, modo='sha256', n_processos=None, blocos_por_processo=4, verbose=True):
+    """Mesmo resultado de fingerprint_linhas, dividindo as linhas em blocos entre processos.
+
+    Com verbose=True imprime a vazão (linhas/s) de cada processo.
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo de hash desconhecido: '{modo}' (use um de {MODOS})")
+    n_processos = n_processos or os.cpu_count() or 1
+    matriz = matriz_linhas(dados)
+    n = len(matriz)
+    if n == 0 or matriz.shape[1] == 0:
+        return _fingerprint_matriz(matriz, modo)
+    tipo = np.dtype(_TIPO_CHAVE[modo])
+    entrada = shared_memory.SharedMemory(create=True, size=matriz.nbytes)
+    saida = shared_memory.SharedMemory(create=True, size=n * tipo.itemsize)
+    try:
+        np.ndarray(matriz.shape, dtype=np.uint64, buffer=entrada.buf)[:] = matriz
+        n_blocos = min(n, n_processos * blocos_por_processo)
+        limites = np.linspace(0, n, n_blocos + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=n_processos) as pool:
+            tarefas = [pool.submit(_trabalhador, entrada.name, matriz.shape, saida.name, modo, ini, fim)
+                       for ini, fim in zip(limites[:-1], limites[1:])]
+            estatisticas = [t.result() for t in tarefas]
+        # Os blocos foram gravados nas suas posições: a ordem das linhas já está preservada
+        chaves = np.ndarray((n,), dtype=tipo, buffer=saida.buf).copy()
+    finally:
+        entrada.close()
+        entrada.unlink()
+        saida.close()
+        saida.unlink()
+    if verbose:
+        por_processo = {}
+        for pid, linhas, tempo in estatisticas:
+            total = por_processo.setdefault(pid, [0, 0.0])
+            total[0] += linhas
+            total[1] += tempo
+        for pid, (linhas, tempo) in por_processo.items():
+            print(f"Processo {pid}: {linhas} linhas em {tempo:.4f} s | {linhas/tempo:,.0f} linhas/s")
+    return chaves
+
+def curva_speedup(dados, modo='sha256', max_processos=None):
+    """Mede o fingerprint paralelo com 1..N processos e imprime o speedup em relação a 1"""
+    max_processos = max_processos or os.cpu_count() or 1
+    resultados = []
+    for n_processos in range(1, max_processos + 1):
+        inicio = time.perf_counter()
+        fingerprint_linhas_paralelo(dados, modo, n_processos=n_processos, verbose=False)
+        tempo = time.perf_counter() - inicio
+        speedup = resultados[0][1] / tempo if resultados else 1.0
+        resultados.append((n_processos, tempo, speedup))
+        print(f"{n_processos} processo(s): {tempo:.4f} s | {len(dados)/tempo:,.0f} linhas/s | speedup = {speedup:.2f}x")
+    return resultados
+
+# Observação: ao ler um elemento de um array 'S16'/'S32' o NumPy remove os bytes nulos
+# finais, então as chaves em bytes circulam sem eles e são completadas só para exibição
+
+def chave_para_hex(chave, modo='hash64'):
+    """Representação hexadecimal de uma chave (para exibição)"""
+    if modo == 'hash64':
+        return f"{int(chave):016x}"
+    return bytes(chave).ljust(_LARGURA[modo], b'\0').hex()
+
+def hex_para_chave(texto, modo='hash64'):
+    """Converte o hexadecimal digitado pelo usuário de volta para o tipo de chave do modo"""
+    if modo == 'hash64':
+        return np.uint64(int(texto, 16))
+    return bytes.fromhex(texto).rstrip(b'\0')
@@ -1,36 +1,49 @@
-import pandas as pd
-import hashlib
 from collections import defaultdict
+from Dados import carregar_dados
+from HashLinhas import fingerprint_linhas, fingerprint_linhas_paralelo, chave_para_hex, hex_para_chave
+import numpy as np
+from TabelaHash import TabelaLinhas, IndiceHashAberto
 
 # 1. Carregar dataset
-df = pd.read_csv('energydata_complete.csv')
+df = carregar_dados(colunas_derivadas=False)
 
-# 2. Função para gerar hash SHA256 de uma linha
-def hash_row(row):
-    row_str = ','.join(map(str, row.values))
-    hash_object = hashlib.sha256(row_str.encode('utf-8'))
-    return hash_object.hexdigest()
+# 2. Modo de fingerprint das linhas: 'hash64', 'hash128' ou 'sha256' (ver HashLinhas.MODOS)
+MODO_HASH = 'sha256'
+PARALELO = False  # True: divide o cálculo entre processos (útil em frames grandes)
 
-# 3. Criar coluna de hash no DataFrame
-df['hash'] = df.apply(hash_row, axis=1)
+# 3. Criar coluna de hash no DataFrame (todas as linhas de uma vez, direto dos bytes)
+if PARALELO:
+    df['hash'] = fingerprint_linhas_paralelo(df, MODO_HASH)
+else:
+    df['hash'] = fingerprint_linhas(df, MODO_HASH)
 
 # 4. Tabela Hash e duplicatas
-hash_table = {}
+# A tabela guarda só hash -> número da linha; os valores ficam nas colunas do df
+# e só são montados como dict quando uma busca encontra a linha
+hash_table = TabelaLinhas(df)
 duplicates = defaultdict(list)  # Para armazenar duplicatas
 
 def inserir_linha(indice):
-    row = df.loc[indice]
-    hash_key = row['hash']
+    hash_key = df.at[indice, 'hash']
     if hash_key in hash_table:
         print(f"⚠️ Linha {indice} já está presente na tabela hash (duplicata).")
         duplicates[hash_key].append(indice)
     else:
-        hash_table[hash_key] = row.to_dict()
+        hash_table[hash_key] = indice
         print(f"✅ Linha {indice} inserida na tabela hash.")
 
+def inserir_bloco(bloco):
+    # Inserção em lote (ex.: um bloco vindo de ler_em_blocos), sem mensagem por linha
+    # O índice do bloco é o número global da linha no dataset
+    if 'hash' not in bloco.columns:
+        bloco = bloco.assign(hash=fingerprint_linhas(bloco, MODO_HASH))
+    duplicadas = hash_table.inserir_muitos(bloco['hash'], bloco.index)
+    for hash_key, indice in duplicadas:
+        duplicates[hash_key].append(indice)
+    return len(bloco) - len(duplicadas)
+
 def remover_linha(indice):
-    row = df.loc[indice]
-    hash_key = row['hash']
+    hash_key = df.at[indice, 'hash']
     if hash_key in hash_table:
         del hash_table[hash_key]
         print(f"✅ Linha {indice} removida da tabela hash.")
@@ -38,8 +51,7 @@ def remover_linha(indice):
         print(f"❌ Linha {indice} não encontrada na tabela hash.")
 
 def buscar_por_indice(indice):
-    row = df.loc[indice]
-    hash_key = row['hash']
+    hash_key = df.at[indice, 'hash']
     result = hash_table.get(hash_key)
     if result:
         print(f"🔎 Linha encontrada: {result}")
@@ -49,7 +61,7 @@ def buscar_por_indice(indice):
 def buscar_por_hash(hash_key):
     result = hash_table.get(hash_key)
     if result:
-        print(f"🔎 Linha correspondente ao hash {hash_key}: {result}")
+        print(f"🔎 Linha correspondente ao hash {chave_para_hex(hash_key, MODO_HASH)}: {result}")
     else:
         print("❌ Hash não encontrado na tabela hash.")
 
@@ -57,13 +69,26 @@ def relatorio_duplicatas():
     if duplicates:
         print(f"⚠️ Foram encontradas {len(duplicates)} duplicatas de hash:")
         for h, idxs in duplicates.items():
-            print(f"Hash: {h}, Linhas duplicadas: {idxs}")
+            print(f"Hash: {chave_para_hex(h, MODO_HASH)}, Linhas duplicadas: {idxs}")
     else:
         print("✅ Nenhuma duplicata de hash encontrada.")
 
+def duplicatas_em_lote():
+    # Deduplicação do dataset inteiro num índice de endereçamento aberto (fingerprints de 64 bits)
+    chaves = fingerprint_linhas(df.drop(columns='hash'), 'hash64')
+    indice = IndiceHashAberto(capacidade=len(chaves))
+    novas = indice.insert_many(chaves, np.arange(len(chaves)))
+    repetidas = np.flatnonzero(~novas)
+    if len(repetidas):
+        originais = indice.lookup_many(chaves[repetidas])
+        print(f"⚠️ {len(repetidas)} linhas repetidas encontradas:")
+        for linha, original in zip(repetidas, originais):
+            print(f"Linha {linha} repete a linha {original}")
+    else:
+        print(f"✅ Nenhuma linha repetida entre as {len(chaves)} linhas (índice com {indice.capacidade} slots).")
+
 # Preenche a tabela hash inicialmente
-for idx, row in df.iterrows():
-    inserir_linha(idx)
+inserir_bloco(df)
 
 print(f"Tamanho inicial da Tabela Hash: {len(hash_table)}")
 
@@ -75,6 +100,7 @@ while True:
     print("3 - Remover linha por índice")
     print("4 - Buscar linha por hash")
     print("5 - Relatório de duplicatas")
+    print("6 - Verificar linhas repetidas em lote (índice aberto)")
     print("0 - Sair")
     opcao = input("Escolha a operação: ")
     if opcao == '0':
@@ -91,8 +117,15 @@ while True:
         remover_linha(indice)
     elif opcao == '4':
         hash_key = input("Digite o hash (em hexadecimal): ")
+        try:
+            hash_key = hex_para_chave(hash_key, MODO_HASH)
+        except ValueError:
+            print("Hash inválido, deve ser hexadecimal.")
+            continue
         buscar_por_hash(hash_key)
     elif opcao == '5':
         relatorio_duplicatas()
+    elif opcao == '6':
+        duplicatas_em_lote()
     else:
         print("Opção inválida. Tente novamente.")
\ No newline at end of file
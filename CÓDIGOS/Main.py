@@ -1,5 +1,12 @@
 import sys
 import os
+import pandas as pd
+
+# Copy-on-Write para todos os módulos do menu: as visões do dataset entregues por Dados.carregar_dados
+# podem ser cópias rasas (a partir do pandas 3.0 o comportamento já é sempre esse)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 def menu():
      
     # Nome da pasta
@@ -27,12 +34,18 @@ def menu():
     print("Bench Marks:")
     print("10 - Bench Mark Árvore Binária")
     print("11 - Bench Mark Bloom Filter")
+    print("25 - Bench Mark Filtro Cuckoo x Bloom Filter")
+    print("26 - Bench Mark Bloom Filter Blocado")
+    print("27 - Bench Mark Bloom Filter Escalável")
+    print("28 - Bench Mark Bloom Filter com Contadores")
     print("12 - Bench Mark Grafo")
     print("13 - Bench Mark Hashing")
     print("14 - Bench Mark Segment Tree")
     print("15 - Bench Mark Skip List")
+    print("29 - Bench Mark Skip List Concorrente")
     print("Optimização do Hashing (Cuckoo Hashing)")
     print("16 - Cuckoo Hashing")
+    print("24 - Bench Mark Cuckoo Hashing")
     print("Restrições:")
     print("17 - Restrição Árvpre Binária")
     print("18 - Restrição Bloom Filter")
@@ -103,6 +116,24 @@ if __name__ == "__main__":
             import RestriçãoSkipList
         elif opcao == "23":
             import AprendizadoNãoSupervisionado
+        elif opcao == "24":
+            from BenchMark_CuckooHashing import benchmark_cuckoo_hashing
+            benchmark_cuckoo_hashing()
+        elif opcao == "25":
+            from BenchMark_BloomFilter import benchmark_filtro_cuckoo
+            benchmark_filtro_cuckoo()
+        elif opcao == "26":
+            from BenchMark_BloomFilter import benchmark_bloom_blocado
+            benchmark_bloom_blocado()
+        elif opcao == "27":
+            from BenchMark_BloomFilter import benchmark_bloom_escalavel
+            benchmark_bloom_escalavel()
+        elif opcao == "28":
+            from BenchMark_BloomFilter import benchmark_bloom_contador
+            benchmark_bloom_contador()
+        elif opcao == "29":
+            from BenchMark_SkipList import benchmark_skiplist_concorrente
+            benchmark_skiplist_concorrente()
         else:
             print("Opção inválida.")
         
\ No newline at end of file
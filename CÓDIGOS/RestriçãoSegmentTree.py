@@ -1,9 +1,9 @@
 from Restrições import checar_memoria, interrupcao, acesso_banco_simulado, sensor_leitura, simular_entrada_continua
+from Dados import carregar_dados
 import BenchMark_SegmentTree
 import time
 import random
 import numpy as np
-import pandas as pd
 import sys
 import matplotlib.pyplot as plt
 from sklearn.tree import DecisionTreeRegressor, plot_tree
@@ -11,7 +11,7 @@ from sklearn.metrics import mean_squared_error, r2_score
 
 # R12: Simular latência ao carregar dados
 acesso_banco_simulado()
-data = pd.read_csv("energydata_complete.csv")
+data = carregar_dados()  # já traz date, hour, day_of_week e is_weekend
 
 # R18: Aplica sensores defeituosos em colunas de sensores
 sensor_cols = ['T1', 'RH_1', 'T2', 'RH_2', 'T3', 'RH_3', 'T4', 'RH_4',
@@ -20,12 +20,6 @@ sensor_cols = ['T1', 'RH_1', 'T2', 'RH_2', 'T3', 'RH_3', 'T4', 'RH_4',
 for col in sensor_cols:
     data[col] = data[col].apply(sensor_leitura)
 
-# Features e target
-data['date'] = pd.to_datetime(data['date'])
-data['hour'] = data['date'].dt.hour
-data['day_of_week'] = data['date'].dt.dayofweek
-data['is_weekend'] = data['day_of_week'].apply(lambda x: 1 if x >= 5 else 0)
-
 features = ['lights', 'T1', 'RH_1', 'T2', 'RH_2', 'T3', 'RH_3', 'T4', 'RH_4',
             'T5', 'RH_5', 'T6', 'RH_6', 'T7', 'RH_7', 'T8', 'RH_8', 'T9', 'RH_9',
             'T_out', 'Press_mm_hg', 'RH_out', 'Windspeed', 'Visibility', 'Tdewpoint',
@@ -1,7 +1,6 @@
 import time
 import random
 import numpy as np
-import pandas as pd
 import sys
 
 # R1 - Limitação de memória RAM disponível (simulação para Windows)
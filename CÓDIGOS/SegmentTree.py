@@ -1,58 +1,100 @@
-import pandas as pd
 import numpy as np
+from Dados import carregar_colunas
 
 # =====================
 # Classe Segment Tree
+# A árvore fica num array float64 (folhas em [n, 2n), nó i = filho 2i + filho 2i+1).
+# Os nós internos são montados nível a nível: cada faixa de índices [2^k, 2^(k+1)) é uma soma
+# vetorizada das posições pares e ímpares da faixa de baixo. Acessos pontuais (update/query)
+# usam uma memoryview do array, sem o custo de escalares NumPy.
 class SegmentTree:
     def __init__(self, data):
-        self.n = len(data)
-        self.tree = [0.0] * (2 * self.n)
+        self.n = len(data)       # capacidade (número de folhas)
+        self.count = self.n      # folhas ocupadas
+        self._alocar(self.n)
         self.build(data)
-    
+
+    def _alocar(self, n):
+        self.tree = np.zeros(2 * n)
+        self._tree = memoryview(self.tree)
+
+    def _recalcular(self, lo, hi):
+        # Recalcula os nós internos lo..hi e todos os seus ancestrais, uma faixa por nível
+        while hi >= 1:
+            lo = max(lo, 1)
+            self.tree[lo:hi + 1] = self.tree[2 * lo:2 * hi + 2:2] + self.tree[2 * lo + 1:2 * hi + 2:2]
+            lo //= 2
+            hi //= 2
+
     def build(self, data):
-        for i in range(self.n):
-            self.tree[self.n + i] = data[i]
-        for i in range(self.n - 1, 0, -1):
-            self.tree[i] = self.tree[2 * i] + self.tree[2 * i + 1]
+        self.tree[self.n:self.n + len(data)] = data
+        # Do nível mais fundo para a raiz: os filhos de [2^k, 2^(k+1)) já estão prontos
+        topo = 1 << max(self.n - 1, 0).bit_length()
+        while topo > 1:
+            inicio = topo // 2
+            fim = min(topo, self.n)
+            if inicio < fim:
+                self.tree[inicio:fim] = self.tree[2 * inicio:2 * fim:2] + self.tree[2 * inicio + 1:2 * fim:2]
+            topo = inicio
+
+    def extend(self, values):
+        # Acrescenta um bloco de valores ao final (ex.: vindo de ler_em_blocos)
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        start = self.count
+        end = start + len(values)
+        if end > self.n:
+            # Sem folhas livres: dobra a capacidade e reconstrói
+            leaves = np.concatenate([self.tree[self.n:self.n + self.count], values])
+            self.n = max(2 * self.n, end)
+            self.count = end
+            self._alocar(self.n)
+            self.build(leaves)
+            return
+        self.tree[self.n + start:self.n + end] = values
+        self.count = end
+        # Recalcula só os ancestrais do trecho alterado, nível por nível
+        self._recalcular((self.n + start) // 2, (self.n + end - 1) // 2)
     
     def update(self, index, value):
+        tree = self._tree
         index += self.n
-        self.tree[index] = value
+        tree[index] = value
         while index > 1:
             index //= 2
-            self.tree[index] = self.tree[2 * index] + self.tree[2 * index + 1]
+            tree[index] = tree[2 * index] + tree[2 * index + 1]
     
     def remove(self, index):
         self.update(index, 0.0)
     
     def query(self, left, right):
+        tree = self._tree
         result = 0.0
         left += self.n
         right += self.n
         while left < right:
             if left % 2 == 1:
-                result += self.tree[left]
+                result += tree[left]
                 left += 1
             if right % 2 == 1:
                 right -= 1
-                result += self.tree[right]
+                result += tree[right]
             left //= 2
             right //= 2
         return result
 
 # =====================
-# Carregar dataset
-data = pd.read_csv('energydata_complete.csv')
-
-# Selecionar colunas numéricas
-num_cols = data.select_dtypes(include=[np.number]).columns
+# Carregar apenas as colunas numéricas (mapeadas do cache colunar)
+data = carregar_colunas()
+num_cols = list(data)
 
 # Criar Segment Trees para cada coluna
 segment_trees = {}
 
 for col in num_cols:
     print(f"✅ Criando Segment Tree para coluna: {col}")
-    segment_trees[col] = SegmentTree(data[col].values)
+    segment_trees[col] = SegmentTree(data[col])
 
 # =====================
 # Interface de operações
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from Dados import carregar_dados
 
 def simular_cenarios(df, horas_futuras=24, num_cenarios=5):
     # Exemplo simples: simula cenários variando T_out com ruído
@@ -14,7 +15,7 @@ def simular_cenarios(df, horas_futuras=24, num_cenarios=5):
     return pd.concat(cenarios)
 
 # Carregar o dataset
-df = pd.read_csv('energydata_complete.csv', parse_dates=['date'])
+df = carregar_dados(colunas_derivadas=False)
 
 # Adicionar colunas de hora e dia da semana, se ainda não existirem
 if 'hora' not in df.columns:
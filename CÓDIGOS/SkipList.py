@@ -1,131 +1,46 @@
-import random
 import pandas as pd
-
-# ----------------------------
-# Estrutura de Nó para Skip List
-class Node:
-    def __init__(self, key, level):
-        self.key = key
-        self.forward = [None] * (level + 1)
-
-# ----------------------------
-# Estrutura da Skip List
-class SkipList:
-    def __init__(self, max_lvl, P):
-        self.MAXLVL = max_lvl
-        self.P = P
-        self.header = self.createNode(self.MAXLVL, None)
-        self.level = 0
-
-    def createNode(self, lvl, key):
-        return Node(key, lvl)
-
-    def randomLevel(self):
-        lvl = 0
-        while random.random() < self.P and lvl < self.MAXLVL:
-            lvl += 1
-        return lvl
-
-    def insertElement(self, key):
-        update = [None] * (self.MAXLVL + 1)
-        current = self.header
-
-        for i in range(self.level, -1, -1):
-            while current.forward[i] and current.forward[i].key < key:
-                current = current.forward[i]
-            update[i] = current
-
-        current = current.forward[0]
-
-        if current is None or current.key != key:  # evitar repetidos
-            rlevel = self.randomLevel()
-            if rlevel > self.level:
-                for i in range(self.level + 1, rlevel + 1):
-                    update[i] = self.header
-                self.level = rlevel
-
-            n = self.createNode(rlevel, key)
-            for i in range(rlevel + 1):
-                n.forward[i] = update[i].forward[i]
-                update[i].forward[i] = n
-
-    def searchElement(self, key, verbose=False):
-        current = self.header
-        path = []
-        for i in range(self.level, -1, -1):
-            pos = 0
-            while current.forward[i] and current.forward[i].key < key:
-                current = current.forward[i]
-                pos += 1
-            path.append((i, pos, current.key if current.key is not None else 'Header'))
-        current = current.forward[0]
-        if current and current.key == key:
-            if verbose:
-                pass  # Retirado o print
-            return True
-        else:
-            if verbose:
-                pass  # Retirado o print
-            return False
-
-    def deleteElement(self, key):
-        update = [None] * (self.MAXLVL + 1)
-        current = self.header
-
-        for i in range(self.level, -1, -1):
-            while current.forward[i] and current.forward[i].key < key:
-                current = current.forward[i]
-            update[i] = current
-
-        current = current.forward[0]
-
-        if current and current.key == key:
-            for i in range(self.level + 1):
-                if update[i].forward[i] != current:
-                    continue
-                update[i].forward[i] = current.forward[i]
-
-            while self.level > 0 and self.header.forward[self.level] is None:
-                self.level -= 1
-            # Removido o print
-        else:
-            # Removido o print
-            pass
-
-    def updateElement(self, old_key, new_key):
-        if self.searchElement(old_key):
-            self.deleteElement(old_key)
-            self.insertElement(new_key)
-            # Removido o print
-        else:
-            # Removido o print
-            pass
-
-    def displayList(self):
-        # Removido o print da Skip List
-        pass
+import numpy as np
+import threading
+from Dados import colunas_numericas as listar_colunas_numericas, ler_em_blocos, carregar_colunas
+from EstruturaSkipList import SkipList, SkipListArray, SkipListIndexavel, SkipListConcorrente, SkipListTemporal
 
 # ----------------------------
 # Carregando o dataset real
 
 try:
-    df = pd.read_csv('energydata_complete.csv')
+    colunas_numericas = listar_colunas_numericas()
 except FileNotFoundError:
     print("Arquivo 'energydata_complete.csv' não encontrado. Verifique o caminho e tente novamente.")
     exit()
 
-# Selecionar colunas numéricas (int64 e float64)
-colunas_numericas = df.select_dtypes(include=['float64', 'int64']).columns
-
-# Criar Skip List para cada coluna numérica
-skip_lists = {}
-
-for coluna in colunas_numericas:
-    skip_list = SkipList(max_lvl=4, P=0.5)
-    valores = df[coluna].dropna().unique()
-    for valor in valores:
-        skip_list.insertElement(valor)
-    skip_lists[coluna] = skip_list
+# Layout dos nós: 'nos' -> objetos com __slots__ | 'arrays' -> chaves e ponteiros em arrays NumPy por nível
+# | 'indexavel' -> nós com spans nos ponteiros (posição e percentis em O(log n))
+# | 'concorrente' -> lazy skip list thread-safe: a ingestão roda numa thread enquanto o menu já consulta
+LAYOUT = 'indexavel'
+classe_skip = {'nos': SkipList, 'arrays': SkipListArray, 'indexavel': SkipListIndexavel,
+               'concorrente': SkipListConcorrente}[LAYOUT]
+
+if LAYOUT == 'concorrente':
+    skip_lists = {coluna: SkipListConcorrente(P=0.5) for coluna in colunas_numericas}
+
+    def ingerir():
+        for bloco in ler_em_blocos(colunas=colunas_numericas):
+            for coluna in colunas_numericas:
+                skip_lists[coluna].extend(bloco[coluna].dropna().unique())
+        print("\n[ingestão concluída]")
+
+    threading.Thread(target=ingerir, daemon=True).start()
+    print("Ingestão em segundo plano: as consultas já veem os valores carregados até o momento.")
+else:
+    # Criar Skip List para cada coluna numérica, lendo o dataset em blocos:
+    # junta os valores únicos de cada bloco e monta a lista de uma vez (from_sorted ordena e liga em O(n))
+    unicos = {coluna: [] for coluna in colunas_numericas}
+    for bloco in ler_em_blocos(colunas=colunas_numericas):
+        for coluna in colunas_numericas:
+            unicos[coluna].append(bloco[coluna].dropna().unique())
+
+    skip_lists = {coluna: classe_skip.from_sorted(np.concatenate(unicos[coluna]), P=0.5)  # teto de nível adaptativo
+                  for coluna in colunas_numericas}
 
 # Interação para testar operações em uma coluna específica
 col_teste = input("\nDigite o nome da coluna para testar buscas e atualizações: ")
@@ -135,6 +50,8 @@ if col_teste not in skip_lists:
     exit()
 
 skip = skip_lists[col_teste]
+indice_tempo = None  # índice temporal (data -> linha), montado no primeiro uso da opção 9
+datas = None         # colunas 'date' e col_teste lidas junto com o índice (payload -> valor da leitura)
 
 while True:
     print("\nOperações disponíveis:")
@@ -142,6 +59,11 @@ while True:
     print("2 - Remover valor")
     print("3 - Inserir valor")
     print("4 - Atualizar valor")
+    print("5 - Valores num intervalo")
+    print("6 - Posição (quantos valores abaixo)")
+    print("7 - Percentil")
+    print("8 - Buscar vários valores")
+    print("9 - Leituras num intervalo de datas")
     print("0 - Sair")
     opcao = input("Escolha a operação: ")
 
@@ -149,10 +71,59 @@ while True:
         print("Encerrando.")
         break
 
-    if opcao not in ['1','2','3','4','5']:
+    if opcao not in ['1','2','3','4','5','6','7','8','9']:
         print("Opção inválida. Tente novamente.")
         continue
 
+    if opcao in ['6', '7'] and LAYOUT != 'indexavel':
+        print("Disponível só no layout 'indexavel'.")
+        continue
+
+    if opcao == '7':
+        try:
+            q = float(input("Digite o percentil (0-100): "))
+        except ValueError:
+            print("Valor inválido, deve ser numérico.")
+            continue
+        if not 0 <= q <= 100:
+            print("O percentil deve estar entre 0 e 100.")
+            continue
+        print(f"Percentil {q:g}: {skip.percentil(q)}")
+        continue
+
+    if opcao == '9':
+        try:
+            t0 = pd.Timestamp(input("Data inicial (ex.: 2016-01-11 17:00): "))
+            t1 = pd.Timestamp(input("Data final: "))
+        except ValueError:
+            print("Data inválida.")
+            continue
+        if pd.isna(t0) or pd.isna(t1):  # entrada vazia vira NaT, sem erro
+            print("Data inválida.")
+            continue
+        if indice_tempo is None:
+            datas = carregar_colunas(['date', col_teste])
+            indice_tempo = SkipListTemporal.from_sorted(datas['date'], P=0.5)  # payload = número da linha
+        leituras = list(indice_tempo.range(t0.timestamp(), t1.timestamp()))
+        print(f"{len(leituras)} leituras entre {t0} e {t1}")
+        for instante, linha in leituras[:20]:
+            print(f"  {pd.Timestamp(instante, unit='s')} | linha {linha} | {col_teste} = {datas[col_teste][linha]}")
+        if len(leituras) > 20:
+            print("  ...")
+        continue
+
+    if opcao == '8':
+        # Busca em lote: as sondas são ordenadas e cada uma continua de onde a anterior parou
+        entrada = input("Digite os valores separados por vírgula: ")
+        try:
+            valores = [float(v) for v in entrada.split(',') if v.strip()]
+        except ValueError:
+            print("Valor inválido, deve ser numérico.")
+            continue
+        for v, achou in zip(valores, skip.search_many(valores)):
+            print(f"{v}: {'Encontrado' if achou else 'Não encontrado'}")
+        continue
+
     valor = input("Digite o valor (numérico): ")
     try:
         valor = float(valor)
@@ -179,5 +150,18 @@ while True:
             continue
         skip.updateElement(valor, valor_novo)
 
+    elif opcao == '5':
+        limite = input("Digite o limite superior do intervalo: ")
+        try:
+            limite = float(limite)
+        except ValueError:
+            print("Valor inválido, deve ser numérico.")
+            continue
+        encontrados = list(skip.range(valor, limite))
+        print(f"{len(encontrados)} valores entre {valor} e {limite}: {encontrados[:20]}{' ...' if len(encontrados) > 20 else ''}")
+
+    elif opcao == '6':
+        print(f"Valores abaixo de {valor}: {skip.rank(valor)} de {skip.count}")
+
     # Mostrar Skip List após operação (não haverá saída)
     skip.displayList()
\ No newline at end of file
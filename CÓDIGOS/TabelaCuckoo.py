@@ -0,0 +1,626 @@
+import hashlib
+import math
+import random
+import struct
+import numpy as np
+
+class CuckooHashTable:
+    def __init__(self, size=0, max_kicks=20):
+        # O tamanho deve ser pelo menos 2x o número de chaves para evitar loops
+        self.size = size if size > 0 else 101
+        self.table1 = [None] * self.size
+        self.table2 = [None] * self.size
+        self.max_kicks = max_kicks  # Máximo de realocações para evitar loops infinitos
+        self.insert_failures = 0
+
+    def hash1(self, key):
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        return int(hashlib.sha256(key).hexdigest(), 16) % self.size
+
+    def hash2(self, key):
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        return int(hashlib.md5(key).hexdigest(), 16) % self.size
+
+    def insert(self, key, value):
+        for _ in range(self.max_kicks):
+            pos1 = self.hash1(key)
+            if self.table1[pos1] is None:
+                self.table1[pos1] = (key, value)
+                return True
+            if self.table1[pos1][0] == key:
+                self.table1[pos1] = (key, value)
+                return True
+            # Troca (kick out)
+            key, value, self.table1[pos1] = self.table1[pos1][0], self.table1[pos1][1], (key, value)
+
+            pos2 = self.hash2(key)
+            if self.table2[pos2] is None:
+                self.table2[pos2] = (key, value)
+                return True
+            if self.table2[pos2][0] == key:
+                self.table2[pos2] = (key, value)
+                return True
+            # Troca (kick out)
+            key, value, self.table2[pos2] = self.table2[pos2][0], self.table2[pos2][1], (key, value)
+        self.insert_failures += 1
+        print("⚠️ Falha na inserção: número máximo de realocações atingido.")
+        return False
+
+    def extend(self, itens):
+        # Inserção em lote de pares (chave, valor); devolve quantas inserções falharam
+        falhas = 0
+        for key, value in itens:
+            if not self.insert(key, value):
+                falhas += 1
+        return falhas
+
+    def search(self, key):
+        pos1 = self.hash1(key)
+        if self.table1[pos1] is not None and self.table1[pos1][0] == key:
+            return self.table1[pos1][1]
+        pos2 = self.hash2(key)
+        if self.table2[pos2] is not None and self.table2[pos2][0] == key:
+            return self.table2[pos2][1]
+        return None
+
+    def remove(self, key):
+        pos1 = self.hash1(key)
+        if self.table1[pos1] is not None and self.table1[pos1][0] == key:
+            self.table1[pos1] = None
+            return True
+        pos2 = self.hash2(key)
+        if self.table2[pos2] is not None and self.table2[pos2][0] == key:
+            self.table2[pos2] = None
+            return True
+        return False
+
+    def has_collision(self):
+        # Checa se existe alguma chave duplicada em qualquer tabela (não deve ocorrer)
+        seen_hashes1 = set()
+        seen_hashes2 = set()
+        for slot in self.table1:
+            if slot:
+                if slot[0] in seen_hashes1:
+                    return True
+                seen_hashes1.add(slot[0])
+        for slot in self.table2:
+            if slot:
+                if slot[0] in seen_hashes2:
+                    return True
+                seen_hashes2.add(slot[0])
+        return False
+
+    def count_filled(self):
+        return sum(1 for slot in self.table1 if slot is not None) + sum(1 for slot in self.table2 if slot is not None)
+
+# ----------------------------
+# Cuckoo em arrays NumPy para chaves de 64 bits (ex.: fingerprint_linhas(..., 'hash64'))
+# Cada chave recebe um único digest de 64 bits, calculado uma vez e guardado junto dela:
+# os 32 bits baixos escolhem a posição na tabela 1 e os 32 altos a posição na tabela 2,
+# então as realocações nunca recalculam hash. Os valores são ids de linha (int32).
+_MASCARA64 = (1 << 64) - 1
+
+def digest64(chave):
+    # Multiplicação de Fibonacci + xorshift em inteiros Python (caminho escalar):
+    # espalha os bits altos do produto também pela metade baixa do digest
+    x = (int(chave) * 0x9E3779B97F4A7C15) & _MASCARA64
+    return x ^ (x >> 29)
+
+def digest64_lote(chaves):
+    # Mesmo digest64 para um array inteiro de chaves (a multiplicação uint64 já é módulo 2^64)
+    x = np.asarray(chaves, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    return x ^ (x >> np.uint64(29))
+
+class CuckooHashArray:
+    VAZIO = -1
+
+    def __init__(self, size=0, max_kicks=20):
+        self.size = size if size > 0 else 101
+        self.max_kicks = max_kicks
+        self.insert_failures = 0
+        # Tabela 1 ocupa os slots [0, size) e a tabela 2 os slots [size, 2*size)
+        self.chaves = np.zeros(2 * self.size, dtype=np.uint64)
+        self.digests = np.zeros(2 * self.size, dtype=np.uint64)
+        self.ids = np.full(2 * self.size, self.VAZIO, dtype=np.int32)
+        # Visões memoryview dos mesmos arrays: acesso escalar sem criar escalares NumPy
+        self._chaves = memoryview(self.chaves)
+        self._digests = memoryview(self.digests)
+        self._ids = memoryview(self.ids)
+
+    def _slots(self, digest):
+        # 32 bits baixos -> tabela 1, 32 bits altos -> tabela 2
+        return (digest & 0xFFFFFFFF) % self.size, self.size + (digest >> 32) % self.size
+
+    def _localizar(self, chave, digest):
+        s1, s2 = self._slots(digest)
+        if self._ids[s1] != self.VAZIO and self._chaves[s1] == chave:
+            return s1
+        if self._ids[s2] != self.VAZIO and self._chaves[s2] == chave:
+            return s2
+        return None
+
+    def insert(self, chave, id_linha):
+        chave = int(chave)
+        id_linha = int(id_linha)
+        digest = digest64(chave)
+        chaves, digests, ids = self._chaves, self._digests, self._ids
+        slot = self._localizar(chave, digest)
+        if slot is not None:
+            ids[slot] = id_linha
+            return True
+        caminho = []  # slots já trocados, para desfazer a cadeia se as realocações acabarem
+        for _ in range(self.max_kicks):
+            for tabela in (0, 1):
+                slot = self._slots(digest)[tabela]
+                antigo_id = ids[slot]
+                if antigo_id == self.VAZIO:
+                    chaves[slot] = chave
+                    digests[slot] = digest
+                    ids[slot] = id_linha
+                    return True
+                # Troca (kick out): o expulso leva o digest já calculado
+                antiga_chave, antigo_digest = chaves[slot], digests[slot]
+                chaves[slot] = chave
+                digests[slot] = digest
+                ids[slot] = id_linha
+                chave, digest, id_linha = antiga_chave, antigo_digest, antigo_id
+                caminho.append(slot)
+        # Desfaz as trocas do fim para o começo: cada entrada expulsa volta ao seu slot e a
+        # tabela fica como antes; só a chave nova fica de fora
+        for slot in reversed(caminho):
+            chaves[slot], chave = chave, chaves[slot]
+            digests[slot], digest = digest, digests[slot]
+            ids[slot], id_linha = id_linha, ids[slot]
+        self.insert_failures += 1
+        print("⚠️ Falha na inserção: número máximo de realocações atingido.")
+        return False
+
+    def extend(self, itens):
+        falhas = 0
+        for chave, id_linha in itens:
+            if not self.insert(chave, id_linha):
+                falhas += 1
+        return falhas
+
+    def search(self, chave):
+        chave = int(chave)
+        slot = self._localizar(chave, digest64(chave))
+        if slot is None:
+            return None
+        return self._ids[slot]
+
+    def remove(self, chave):
+        chave = int(chave)
+        slot = self._localizar(chave, digest64(chave))
+        if slot is None:
+            return False
+        self._ids[slot] = self.VAZIO
+        return True
+
+    def has_collision(self):
+        chaves = self.chaves[self.ids != self.VAZIO]
+        return len(np.unique(chaves)) != len(chaves)
+
+    def count_filled(self):
+        return int(np.count_nonzero(self.ids != self.VAZIO))
+
+# ----------------------------
+# Cuckoo em buckets de 4 slots (2 buckets candidatos por chave) com stash e crescimento automático
+# Com 4 slots por bucket a tabela passa de 90% de ocupação; quando uma inserção esgota as
+# realocações a chave vai para um stash pequeno, e só quando o stash enche a tabela dobra
+# e tudo é reinserido. A busca continua olhando só 2 buckets (+ o stash).
+class CuckooHashBuckets:
+    VAZIO = -1
+
+    def __init__(self, capacidade=0, slots=4, max_kicks=500, tamanho_stash=8, carga_inicial=0.95):
+        # capacidade = número de chaves esperado (não o dobro, como nas tabelas acima)
+        self.slots = slots
+        self.max_kicks = max_kicks
+        self.tamanho_stash = tamanho_stash
+        self.insert_failures = 0  # sempre 0: falhas viram stash/rehash
+        self.rehashes = 0
+        n_buckets = max(1, int(np.ceil(max(capacidade, 1) / (slots * carga_inicial))))
+        self._alocar(n_buckets)
+
+    def _alocar(self, n_buckets):
+        self.n_buckets = n_buckets
+        total = n_buckets * self.slots
+        self.chaves = np.zeros(total, dtype=np.uint64)
+        self.digests = np.zeros(total, dtype=np.uint64)
+        self.ids = np.full(total, self.VAZIO, dtype=np.int32)
+        self._chaves = memoryview(self.chaves)
+        self._digests = memoryview(self.digests)
+        self._ids = memoryview(self.ids)
+        self.stash = []  # lista de [chave, digest, id]
+        self.count = 0
+
+    def _buckets(self, digest):
+        return (digest & 0xFFFFFFFF) % self.n_buckets, (digest >> 32) % self.n_buckets
+
+    def _localizar(self, chave, digest):
+        # Devolve o slot da chave, ('stash', i) ou None
+        chaves, ids, s = self._chaves, self._ids, self.slots
+        for bucket in self._buckets(digest):
+            for slot in range(bucket * s, bucket * s + s):
+                if ids[slot] != self.VAZIO and chaves[slot] == chave:
+                    return slot
+        for i, item in enumerate(self.stash):
+            if item[0] == chave:
+                return ('stash', i)
+        return None
+
+    def _vaga(self, bucket):
+        ids, s = self._ids, self.slots
+        for slot in range(bucket * s, bucket * s + s):
+            if ids[slot] == self.VAZIO:
+                return slot
+        return None
+
+    def _colocar(self, chave, digest, id_linha):
+        # Insere uma chave que sabidamente não está na tabela
+        chaves, digests, ids = self._chaves, self._digests, self._ids
+        b1, b2 = self._buckets(digest)
+        slot = self._vaga(b1)
+        if slot is None:
+            slot = self._vaga(b2)
+        if slot is None:
+            bucket = random.choice((b1, b2))
+            for _ in range(self.max_kicks):
+                # Expulsa um ocupante aleatório do bucket e leva-o para o seu outro bucket
+                slot = bucket * self.slots + random.randrange(self.slots)
+                antiga_chave, antigo_digest, antigo_id = chaves[slot], digests[slot], ids[slot]
+                chaves[slot], digests[slot], ids[slot] = chave, digest, id_linha
+                chave, digest, id_linha = antiga_chave, antigo_digest, antigo_id
+                a1, a2 = self._buckets(digest)
+                bucket = a2 if bucket == a1 else a1
+                slot = self._vaga(bucket)
+                if slot is not None:
+                    break
+            else:
+                self.stash.append([chave, digest, id_linha])
+                self.count += 1
+                if len(self.stash) > self.tamanho_stash:
+                    self._crescer()
+                return
+        chaves[slot], digests[slot], ids[slot] = chave, digest, id_linha
+        self.count += 1
+
+    def _crescer(self):
+        # Dobra o número de buckets e reinsere tudo (incluindo o stash)
+        ocupados = self.ids != self.VAZIO
+        itens = list(zip(self.chaves[ocupados].tolist(), self.digests[ocupados].tolist(),
+                         self.ids[ocupados].tolist()))
+        itens += [tuple(item) for item in self.stash]
+        self.rehashes += 1
+        self._alocar(self.n_buckets * 2)
+        if itens:
+            chaves, digests, ids = (np.array(c) for c in zip(*itens))
+            self._colocar_lote(chaves.astype(np.uint64), digests.astype(np.uint64), ids.astype(np.int32))
+
+    # ----------------------------
+    # Operações em lote: hashing vetorizado e uma passada por slot candidato;
+    # só as chaves que sobram sem vaga passam pelo laço de realocação
+
+    def _buckets_lote(self, digests):
+        n_buckets = np.uint64(self.n_buckets)
+        b1 = (digests & np.uint64(0xFFFFFFFF)) % n_buckets
+        b2 = (digests >> np.uint64(32)) % n_buckets
+        return b1.astype(np.int64), b2.astype(np.int64)
+
+    def _slots_lote(self, digests):
+        # Matriz (n, 2*slots) com os slots dos dois buckets candidatos de cada chave
+        b1, b2 = self._buckets_lote(digests)
+        deslocamentos = np.arange(self.slots)
+        return np.hstack([b1[:, None] * self.slots + deslocamentos, b2[:, None] * self.slots + deslocamentos])
+
+    def _localizar_lote(self, chaves, digests):
+        # Slot de cada chave na tabela principal, ou -1 (o stash é tratado à parte)
+        slots = self._slots_lote(digests)
+        achou = (self.ids[slots] != self.VAZIO) & (self.chaves[slots] == chaves[:, None])
+        posicoes = slots[np.arange(len(chaves)), achou.argmax(axis=1)]
+        return np.where(achou.any(axis=1), posicoes, -1)
+
+    def _chaves_stash(self):
+        # uint64 explícito: comparar com uma lista de int converteria tudo para float64
+        return np.array([item[0] for item in self.stash], dtype=np.uint64)
+
+    def _colocar_lote(self, chaves, digests, ids):
+        # Insere chaves novas e distintas; cada passada tenta um slot candidato para todas as pendentes
+        pendentes = np.arange(len(chaves))
+        # Alterna os dois buckets (slot 0 de b1, slot 0 de b2, ...) para equilibrar a ocupação
+        ordem = np.arange(2 * self.slots).reshape(2, self.slots).T.ravel()
+        slots = self._slots_lote(digests)[:, ordem]
+        for j in range(slots.shape[1]):
+            if not len(pendentes):
+                break
+            alvo = slots[pendentes, j]
+            candidatos = np.flatnonzero(self.ids[alvo] == self.VAZIO)
+            # Várias chaves no mesmo slot vazio: fica a primeira (mesmo critério do IndiceHashAberto)
+            _, primeiros = np.unique(alvo[candidatos], return_index=True)
+            vencedores = candidatos[primeiros]
+            escolhidos = pendentes[vencedores]
+            self.chaves[alvo[vencedores]] = chaves[escolhidos]
+            self.digests[alvo[vencedores]] = digests[escolhidos]
+            self.ids[alvo[vencedores]] = ids[escolhidos]
+            self.count += len(vencedores)
+            restantes = np.ones(len(pendentes), dtype=bool)
+            restantes[vencedores] = False
+            pendentes = pendentes[restantes]
+        for i in pendentes.tolist():
+            self._colocar(int(chaves[i]), int(digests[i]), int(ids[i]))
+
+    def insert_many(self, chaves, ids):
+        """Insere em lote; chaves já presentes (ou repetidas no lote) ficam com o último id"""
+        chaves = np.asarray(chaves, dtype=np.uint64)
+        ids = np.asarray(ids, dtype=np.int32)
+        # Última ocorrência de cada chave do lote, como em inserções sequenciais
+        _, ultimas = np.unique(chaves[::-1], return_index=True)
+        ultimas = np.sort(len(chaves) - 1 - ultimas)
+        chaves, ids = chaves[ultimas], ids[ultimas]
+        digests = digest64_lote(chaves)
+        posicoes = self._localizar_lote(chaves, digests)
+        existentes = posicoes >= 0
+        self.ids[posicoes[existentes]] = ids[existentes]
+        novas = ~existentes
+        if self.stash:
+            no_stash = novas & np.isin(chaves, self._chaves_stash())
+            for chave, id_linha in zip(chaves[no_stash].tolist(), ids[no_stash].tolist()):
+                self.insert(chave, id_linha)
+            novas &= ~no_stash
+        # Cresce antes, se o lote não cabe com a carga inicial da tabela
+        while self.count + novas.sum() > self.n_buckets * self.slots:
+            self._crescer()
+        self._colocar_lote(chaves[novas], digests[novas], ids[novas])
+        return True
+
+    def search_many(self, chaves):
+        """Busca em lote; devolve (máscara de encontradas, ids) com VAZIO onde não encontrou"""
+        chaves = np.asarray(chaves, dtype=np.uint64)
+        posicoes = self._localizar_lote(chaves, digest64_lote(chaves))
+        encontradas = posicoes >= 0
+        valores = np.full(len(chaves), self.VAZIO, dtype=np.int32)
+        valores[encontradas] = self.ids[posicoes[encontradas]]
+        if self.stash:
+            ids_stash = {item[0]: item[2] for item in self.stash}
+            for i in np.flatnonzero(~encontradas & np.isin(chaves, self._chaves_stash())):
+                id_linha = ids_stash.get(int(chaves[i]))
+                if id_linha is not None:
+                    valores[i] = id_linha
+                    encontradas[i] = True
+        return encontradas, valores
+
+    def remove_many(self, chaves):
+        """Remove em lote; devolve a máscara das chaves que estavam na tabela"""
+        chaves = np.asarray(chaves, dtype=np.uint64)
+        posicoes = self._localizar_lote(chaves, digest64_lote(chaves))
+        removidas = posicoes >= 0
+        unicas = np.unique(posicoes[removidas])
+        self.ids[unicas] = self.VAZIO
+        self.count -= len(unicas)
+        if self.stash:
+            # Só as chaves que de fato estão no stash passam pelo remove escalar
+            no_stash = ~removidas & np.isin(chaves, self._chaves_stash())
+            for i in np.flatnonzero(no_stash):
+                removidas[i] = self.remove(chaves[i])
+        return removidas
+
+    def insert(self, chave, id_linha):
+        chave = int(chave)
+        id_linha = int(id_linha)
+        digest = digest64(chave)
+        encontrado = self._localizar(chave, digest)
+        if encontrado is None:
+            self._colocar(chave, digest, id_linha)
+        elif isinstance(encontrado, tuple):
+            self.stash[encontrado[1]][2] = id_linha
+        else:
+            self._ids[encontrado] = id_linha
+        return True
+
+    def extend(self, itens):
+        falhas = 0
+        for chave, id_linha in itens:
+            if not self.insert(chave, id_linha):
+                falhas += 1
+        return falhas
+
+    def search(self, chave):
+        chave = int(chave)
+        encontrado = self._localizar(chave, digest64(chave))
+        if encontrado is None:
+            return None
+        if isinstance(encontrado, tuple):
+            return self.stash[encontrado[1]][2]
+        return self._ids[encontrado]
+
+    def remove(self, chave):
+        chave = int(chave)
+        encontrado = self._localizar(chave, digest64(chave))
+        if encontrado is None:
+            return False
+        if isinstance(encontrado, tuple):
+            del self.stash[encontrado[1]]
+        else:
+            self._ids[encontrado] = self.VAZIO
+        self.count -= 1
+        return True
+
+    def has_collision(self):
+        chaves = np.concatenate([self.chaves[self.ids != self.VAZIO],
+                                 self._chaves_stash()])
+        return len(np.unique(chaves)) != len(chaves)
+
+    def count_filled(self):
+        return self.count
+
+    def load_factor(self):
+        return self.count / (self.n_buckets * self.slots)
+
+# ----------------------------
+# Filtro cuckoo: alternativa ao BloomFilter que permite remoção
+# Cada valor vira só um fingerprint curto (f bits) guardado num de dois buckets de 4 slots;
+# o segundo bucket sai do primeiro e do próprio fingerprint (b2 = (hash(fp) - b1) mod n, e
+# vice-versa), então as realocações não precisam do valor original. Os buckets (4*f bits cada)
+# ficam empacotados em sequência num array uint64, e f é escolhido pela taxa de falso positivo pedida.
+class CuckooFilter:
+    VAZIO = 0
+
+    def __init__(self, capacidade, taxa_fp=0.01, slots=4, max_kicks=500, tamanho_stash=8):
+        if not 0 < taxa_fp < 1:
+            raise ValueError("taxa_fp deve estar entre 0 e 1")
+        self.slots = slots
+        self.max_kicks = max_kicks
+        self.tamanho_stash = tamanho_stash
+        self.taxa_fp = taxa_fp
+        self.insert_failures = 0
+        # Falso positivo ~ 2*slots / 2^f; f limitado para os slots caberem em 64 bits
+        self.bits_fp = min(64 // slots, max(4, math.ceil(math.log2(2 * slots / taxa_fp))))
+        self._mascara_fp = (1 << self.bits_fp) - 1
+        self.n_buckets = max(2, math.ceil(max(1, capacidade) / (slots * 0.95)))
+        self._bits_bucket = slots * self.bits_fp
+        self._mascara_bucket = (1 << self._bits_bucket) - 1
+        # Uma palavra extra no fim: um bucket pode atravessar a fronteira entre duas palavras
+        self.tabela = np.zeros((self.n_buckets * self._bits_bucket + 63) // 64 + 1, dtype=np.uint64)
+        self._tabela = memoryview(self.tabela)
+        self.stash = []  # lista de [bucket, fingerprint]
+        self.count = 0
+
+    @staticmethod
+    def _misturar(x):
+        # Finalizador do splitmix64: aqui o digest64 não basta, porque valores como 17.5 e 18.0
+        # têm os bits baixos zerados e cairiam todos nos mesmos buckets
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASCARA64
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASCARA64
+        return x ^ (x >> 31)
+
+    def _indice_fp(self, item):
+        # Bits crus do float64: 32 baixos do digest -> bucket, 32 altos -> fingerprint (nunca 0)
+        digest = self._misturar(struct.unpack('<Q', struct.pack('<d', float(item)))[0])
+        fp = (digest >> 32) % self._mascara_fp + 1
+        return (digest & 0xFFFFFFFF) % self.n_buckets, fp
+
+    def _alternativo(self, bucket, fp):
+        return (self._misturar(fp) - bucket) % self.n_buckets
+
+    def _ler_bucket(self, bucket):
+        # Os bits do bucket, lidos das (no máximo) duas palavras que ele ocupa
+        posicao = bucket * self._bits_bucket
+        i, deslocamento = posicao >> 6, posicao & 63
+        palavras = self._tabela[i] | (self._tabela[i + 1] << 64)
+        return (palavras >> deslocamento) & self._mascara_bucket
+
+    def _gravar_bucket(self, bucket, valor):
+        posicao = bucket * self._bits_bucket
+        i, deslocamento = posicao >> 6, posicao & 63
+        palavras = self._tabela[i] | (self._tabela[i + 1] << 64)
+        palavras &= ~(self._mascara_bucket << deslocamento)
+        palavras |= valor << deslocamento
+        self._tabela[i] = palavras & _MASCARA64
+        self._tabela[i + 1] = palavras >> 64
+
+    def _procurar(self, bucket, fp):
+        valor, f, m = self._ler_bucket(bucket), self.bits_fp, self._mascara_fp
+        for j in range(self.slots):
+            if (valor >> (j * f)) & m == fp:
+                return j
+        return None
+
+    def _ler(self, bucket, j):
+        return (self._ler_bucket(bucket) >> (j * self.bits_fp)) & self._mascara_fp
+
+    def _gravar(self, bucket, j, fp):
+        deslocamento = j * self.bits_fp
+        valor = self._ler_bucket(bucket) & ~(self._mascara_fp << deslocamento)
+        self._gravar_bucket(bucket, valor | (fp << deslocamento))
+
+    def _esvaziar_stash(self):
+        # Devolve à tabela os fingerprints do stash que já têm vaga num dos seus dois buckets
+        restantes = []
+        for bucket, fp in self.stash:
+            for candidato in (bucket, self._alternativo(bucket, fp)):
+                j = self._procurar(candidato, self.VAZIO)
+                if j is not None:
+                    self._gravar(candidato, j, fp)
+                    break
+            else:
+                restantes.append([bucket, fp])
+        self.stash = restantes
+
+    def add(self, item):
+        # Como num multiconjunto, valores repetidos ocupam um slot por inserção
+        b1, fp = self._indice_fp(item)
+        b2 = self._alternativo(b1, fp)
+        for bucket in (b1, b2):
+            j = self._procurar(bucket, self.VAZIO)
+            if j is not None:
+                self._gravar(bucket, j, fp)
+                self.count += 1
+                return True
+        if len(self.stash) >= self.tamanho_stash:
+            # Deleções podem ter aberto vagas para os fingerprints do stash
+            self._esvaziar_stash()
+        if len(self.stash) >= self.tamanho_stash:
+            # Filtro cheio: recusa antes de expulsar qualquer fingerprint, senão o último
+            # expulso (de um item já aceito) se perderia e o filtro daria falso negativo
+            self.insert_failures += 1
+            print("⚠️ Falha na inserção: filtro cuckoo cheio.")
+            return False
+        bucket = random.choice((b1, b2))
+        for _ in range(self.max_kicks):
+            j = random.randrange(self.slots)
+            expulso = self._ler(bucket, j)
+            self._gravar(bucket, j, fp)
+            fp = expulso
+            bucket = self._alternativo(bucket, fp)
+            j = self._procurar(bucket, self.VAZIO)
+            if j is not None:
+                self._gravar(bucket, j, fp)
+                self.count += 1
+                return True
+        # Há espaço garantido no stash para o último expulso
+        self.stash.append([bucket, fp])
+        self.count += 1
+        return True
+
+    def check(self, item):
+        b1, fp = self._indice_fp(item)
+        if self._procurar(b1, fp) is not None:
+            return True
+        b2 = self._alternativo(b1, fp)
+        if self._procurar(b2, fp) is not None:
+            return True
+        return any(fp_stash == fp and bucket in (b1, b2) for bucket, fp_stash in self.stash)
+
+    def delete(self, item):
+        # Só remova valores que foram inseridos: apagar um falso positivo remove outro valor
+        b1, fp = self._indice_fp(item)
+        for bucket in (b1, self._alternativo(b1, fp)):
+            j = self._procurar(bucket, fp)
+            if j is not None:
+                self._gravar(bucket, j, self.VAZIO)
+                self.count -= 1
+                if self.stash:
+                    self._esvaziar_stash()
+                return True
+        b2 = self._alternativo(b1, fp)
+        for i, (bucket, fp_stash) in enumerate(self.stash):
+            if fp_stash == fp and bucket in (b1, b2):
+                del self.stash[i]
+                self.count -= 1
+                return True
+        return False
+
+    def extend(self, itens):
+        falhas = 0
+        for item in itens:
+            if not self.add(item):
+                falhas += 1
+        return falhas
+
+    def bits_por_elemento(self):
+        return self.tabela.nbytes * 8 / max(self.count, 1)
+
+    def load_factor(self):
+        return self.count / (self.n_buckets * self.slots)
@@ -0,0 +1,167 @@
+import numpy as np
+import pandas as pd
+
+# ----------------------------
+# Tabela hash compacta: digest -> número da linha
+# Os valores da linha continuam nos arrays de coluna (compartilhados com o DataFrame)
+# e só viram dict quando uma busca pede a linha.
+class TabelaLinhas:
+    def __init__(self, dados):
+        # dados: DataFrame ou dict {coluna: array}; nada é copiado
+        if isinstance(dados, pd.DataFrame):
+            self.colunas = {c: dados[c].to_numpy() for c in dados.columns}
+        else:
+            self.colunas = dict(dados)
+        self.linhas = {}
+
+    def _materializar(self, linha):
+        resultado = {}
+        for nome, arr in self.colunas.items():
+            valor = arr[linha]
+            if isinstance(valor, np.datetime64):
+                valor = pd.Timestamp(valor)
+            elif isinstance(valor, np.generic):
+                valor = valor.item()
+            resultado[nome] = valor
+        return resultado
+
+    def inserir(self, chave, linha):
+        # Devolve False se a chave já existia (duplicata); a linha original é mantida
+        if chave in self.linhas:
+            return False
+        self.linhas[chave] = int(linha)
+        return True
+
+    def inserir_muitos(self, chaves, linhas):
+        # Inserção em lote; devolve a lista de (chave, linha) duplicadas
+        duplicadas = []
+        for chave, linha in zip(chaves, linhas):
+            if not self.inserir(chave, linha):
+                duplicadas.append((chave, linha))
+        return duplicadas
+
+    def linha(self, chave):
+        return self.linhas.get(chave)
+
+    def get(self, chave, padrao=None):
+        linha = self.linhas.get(chave)
+        if linha is None:
+            return padrao
+        return self._materializar(linha)
+
+    def __setitem__(self, chave, linha):
+        self.linhas[chave] = int(linha)
+
+    def __delitem__(self, chave):
+        del self.linhas[chave]
+
+    def __contains__(self, chave):
+        return chave in self.linhas
+
+    def __len__(self):
+        return len(self.linhas)
+
+# ----------------------------
+# Índice hash de endereçamento aberto (sondagem linear) em arrays NumPy
+# Guarda fingerprints de 64 bits e ids de linha int32 em dois arrays paralelos;
+# inserção e busca em lote avançam todas as chaves pendentes juntas, sem laço por chave.
+class IndiceHashAberto:
+    VAZIO = -1
+    _OURO = np.uint64(0x9E3779B97F4A7C15)
+
+    def __init__(self, capacidade=1024, carga_maxima=0.7):
+        if not 0 < carga_maxima < 1:
+            raise ValueError("carga_maxima deve estar entre 0 e 1")
+        self.carga_maxima = carga_maxima
+        self.count = 0
+        self._alocar(max(8, 1 << (int(capacidade) - 1).bit_length()))
+
+    def _alocar(self, capacidade):
+        self.capacidade = capacidade
+        self.bits = capacidade.bit_length() - 1
+        self.chaves = np.zeros(capacidade, dtype=np.uint64)
+        self.ids = np.full(capacidade, self.VAZIO, dtype=np.int32)
+
+    def _posicoes(self, chaves):
+        # Hash de Fibonacci: os bits altos do produto escolhem o slot
+        return ((chaves * self._OURO) >> np.uint64(64 - self.bits)).astype(np.int64)
+
+    def _crescer(self, necessario):
+        capacidade = self.capacidade
+        while necessario > self.carga_maxima * capacidade:
+            capacidade *= 2
+        if capacidade == self.capacidade:
+            return
+        ocupados = self.ids != self.VAZIO
+        chaves, ids = self.chaves[ocupados], self.ids[ocupados]
+        self._alocar(capacidade)
+        self.count = 0
+        self._inserir(chaves, ids)
+
+    def _inserir(self, chaves, ids):
+        inseridos = np.zeros(len(chaves), dtype=bool)
+        pendentes = np.arange(len(chaves))
+        pos = self._posicoes(chaves)
+        mascara = self.capacidade - 1
+        while len(pendentes):
+            slots = pos[pendentes]
+            ids_slot = self.ids[slots]
+            vazio = ids_slot == self.VAZIO
+            repetida = ~vazio & (self.chaves[slots] == chaves[pendentes])
+            # Várias chaves podem disputar o mesmo slot vazio: a primeira (na ordem de entrada) fica com ele.
+            # np.unique devolve a primeira ocorrência de cada slot entre os candidatos (já em ordem).
+            candidatos = np.flatnonzero(vazio)
+            _, primeiros = np.unique(slots[candidatos], return_index=True)
+            vencedores = candidatos[primeiros]
+            self.chaves[slots[vencedores]] = chaves[pendentes[vencedores]]
+            self.ids[slots[vencedores]] = ids[pendentes[vencedores]]
+            inseridos[pendentes[vencedores]] = True
+            self.count += len(vencedores)
+            # Ocupado por outra chave: avança um slot; perdedores da disputa tentam de novo no mesmo slot
+            avancar = ~vazio & ~repetida
+            pos[pendentes[avancar]] = (slots[avancar] + 1) & mascara
+            resolvidos = repetida.copy()
+            resolvidos[vencedores] = True
+            pendentes = pendentes[~resolvidos]
+        return inseridos
+
+    def insert_many(self, chaves, ids):
+        """Insere em lote; devolve uma máscara com True onde a chave era nova.
+
+        Chaves repetidas (já presentes ou repetidas no próprio lote) mantêm o primeiro id.
+        """
+        chaves = np.asarray(chaves, dtype=np.uint64)
+        ids = np.asarray(ids, dtype=np.int32)
+        self._crescer(self.count + len(chaves))
+        return self._inserir(chaves, ids)
+
+    def lookup_many(self, chaves):
+        """Busca em lote; devolve o array de ids (VAZIO onde a chave não existe)"""
+        chaves = np.asarray(chaves, dtype=np.uint64)
+        resultado = np.full(len(chaves), self.VAZIO, dtype=np.int32)
+        pendentes = np.arange(len(chaves))
+        pos = self._posicoes(chaves)
+        mascara = self.capacidade - 1
+        while len(pendentes):
+            slots = pos[pendentes]
+            ids_slot = self.ids[slots]
+            vazio = ids_slot == self.VAZIO
+            achou = ~vazio & (self.chaves[slots] == chaves[pendentes])
+            resultado[pendentes[achou]] = ids_slot[achou]
+            continua = ~vazio & ~achou
+            pos[pendentes[continua]] = (slots[continua] + 1) & mascara
+            pendentes = pendentes[continua]
+        return resultado
+
+    def insert(self, chave, id_linha):
+        return bool(self.insert_many([chave], [id_linha])[0])
+
+    def lookup(self, chave):
+        id_linha = int(self.lookup_many([chave])[0])
+        return None if id_linha == self.VAZIO else id_linha
+
+    def __contains__(self, chave):
+        return self.lookup(chave) is not None
+
+    def __len__(self):
+        return self.count
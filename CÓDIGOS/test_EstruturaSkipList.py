@@ -0,0 +1,84 @@
+import bisect
+import random
+import sys
+import threading
+import numpy as np
+from EstruturaSkipList import SkipListConcorrente, SkipListIndexavel
+
+def _conferir(lista, esperado):
+    assert len(lista) == len(esperado)
+    assert [lista.select(k) for k in range(len(esperado))] == esperado
+    assert [lista.select(-k) for k in range(1, len(esperado) + 1)] == esperado[::-1]
+    for chave in esperado + [x + 0.5 for x in esperado[:20]] + [-1, 10**6]:
+        assert lista.rank(chave) == bisect.bisect_left(esperado, chave)
+    for q in (0, 10, 25, 50, 75, 90, 100):
+        assert np.isclose(lista.percentil(q), np.percentile(esperado, q))
+
+def test_indexavel_rank_select_percentil():
+    # Inserções e remoções aleatórias: rank/select/percentil têm de bater com sorted()
+    random.seed(2)
+    lista = SkipListIndexavel(max_lvl=8)
+    presentes = set()
+    for _ in range(3000):
+        chave = random.randrange(1000)
+        if random.random() < 0.6:
+            lista.insertElement(chave)
+            presentes.add(chave)
+        else:
+            lista.deleteElement(chave)
+            presentes.discard(chave)
+    _conferir(lista, sorted(presentes))
+
+def test_indexavel_from_sorted_depois_de_alterar():
+    # Spans preenchidos pelo from_sorted continuam certos após inserções e remoções
+    random.seed(3)
+    valores = sorted(random.sample(range(10_000), 500))
+    lista = SkipListIndexavel.from_sorted(valores)
+    _conferir(lista, valores)
+    presentes = set(valores)
+    for chave in random.sample(range(10_000), 400):
+        if chave in presentes:
+            lista.deleteElement(chave)
+            presentes.discard(chave)
+        else:
+            lista.insertElement(chave)
+            presentes.add(chave)
+    _conferir(lista, sorted(presentes))
+
+def test_concorrente_escritores_e_removedores():
+    # Threads intercaladas em chaves disjuntas: o resultado final tem de ser o conjunto esperado
+    random.seed(4)
+    lista = SkipListConcorrente(capacidade=10_000)
+    n_threads, n = 4, 2000
+    iniciais = [2 * i + 1 for i in range(n)]  # ímpares: metade é removida
+    removidas = set(iniciais[::2])
+    for chave in iniciais:
+        lista.insertElement(chave)
+    novas = [2 * i for i in range(n)]  # pares: inseridos pelas threads
+
+    def escrever(t):
+        for chave in novas[t::n_threads]:
+            assert lista.insertElement(chave)
+
+    def remover(t):
+        for chave in iniciais[::2][t::n_threads]:
+            assert lista.deleteElement(chave)
+
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # troca de thread frequente para forçar disputas
+    try:
+        threads = [threading.Thread(target=escrever, args=(t,)) for t in range(n_threads)]
+        threads += [threading.Thread(target=remover, args=(t,)) for t in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(intervalo)
+
+    esperado = sorted(set(novas) | (set(iniciais) - removidas))
+    assert len(lista) == len(esperado)
+    assert all(lista.searchElement(chave) for chave in esperado)
+    assert not any(lista.searchElement(chave) for chave in removidas)
+    assert list(lista.range(-1, 2 * n)) == [float(chave) for chave in esperado]
+    assert list(lista.range(100, 200)) == [float(chave) for chave in esperado if 100 <= chave <= 200]
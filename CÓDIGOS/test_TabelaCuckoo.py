@@ -0,0 +1,60 @@
+import random
+from TabelaCuckoo import CuckooFilter, CuckooHashArray
+
+def test_filtro_cuckoo_cheio_sem_falso_negativo():
+    # Enche o filtro até a inserção falhar: nenhum item aceito pode deixar de ser encontrado
+    random.seed(0)
+    filtro = CuckooFilter(capacidade=200, max_kicks=50, tamanho_stash=2)
+    aceitos = []
+    falhas = 0
+    for i in range(10_000):
+        item = i * 0.37 + 0.001
+        if filtro.add(item):
+            aceitos.append(item)
+        else:
+            falhas += 1
+            if falhas >= 20:
+                break
+    assert falhas > 0
+    assert all(filtro.check(item) for item in aceitos)
+
+def test_cuckoo_array_falha_nao_perde_chaves():
+    # Uma inserção que esgota as realocações não pode tirar da tabela uma chave já inserida
+    tabela = CuckooHashArray(size=11, max_kicks=5)
+    inseridas = {}
+    falhas = 0
+    for chave in range(200):
+        if tabela.insert(chave, chave + 1000):
+            inseridas[chave] = chave + 1000
+        else:
+            falhas += 1
+    assert falhas > 0
+    assert all(tabela.search(chave) == id_linha for chave, id_linha in inseridas.items())
+    assert tabela.count_filled() == len(inseridas)
+
+def test_filtro_cuckoo_stash_esvazia_apos_delete():
+    # Depois de deleções, o stash cheio volta para a tabela e novas inserções são aceitas
+    random.seed(1)
+    filtro = CuckooFilter(capacidade=200, max_kicks=50, tamanho_stash=2)
+    aceitos = []
+    falhas = 0
+    i = 0
+    while falhas < 5:
+        item = i * 0.37 + 0.001
+        i += 1
+        if filtro.add(item):
+            aceitos.append(item)
+        else:
+            falhas += 1
+    assert len(filtro.stash) == filtro.tamanho_stash
+    # Apaga só itens fora do stash: as vagas abertas ficam na tabela
+    fps_stash = {fp for _, fp in filtro.stash}
+    apagados = [item for item in aceitos[::2] if filtro._indice_fp(item)[1] not in fps_stash]
+    for item in apagados:
+        assert filtro.delete(item)
+    assert len(filtro.stash) < filtro.tamanho_stash
+    novos = [-(k * 0.37 + 0.001) for k in range(1, 21)]
+    assert all(filtro.add(item) for item in novos)
+    apagados = set(apagados)
+    restantes = [item for item in aceitos if item not in apagados]
+    assert all(filtro.check(item) for item in restantes + novos)